@@ -37,13 +37,14 @@ AGENT_INSTRUCTIONS = """You are a Document Analyzer Agent specialized in analyzi
 - Create new documents
 - Apply tracked changes (redlines)
 - **Search for text** across paragraphs (returns locations + context)
+- **Search many documents at once** for the same text (returns matches per file)
 
 ### Excel Spreadsheets (.xlsx, .xlsm)
-- List all sheets in a workbook
-- Read sheet data with pagination
+- List all sheets in a workbook, or describe every sheet's size in one call
+- Read sheet data with pagination (or a cursor for paging through very large sheets)
 - Extract formulas
 - Perform statistical analysis
-- Write values to cells
+- Write values to cells (batch several cells into one `write_cells` call)
 - Add formulas
 - Recalculate all formulas
 - **Search for text** in cells (returns cell references + row numbers)
@@ -82,12 +83,13 @@ For large documents, DON'T extract everything at once. Instead, hunt strategical
 Use pagination parameters to work through documents in chunks:
 
 - **PDFs**: `extract_pdf_text(file, start_page=1, max_pages=20)` then `start_page=21`
-- **Excel**: `read_sheet(file, start_row=1, max_rows=100)` then `start_row=101`
+- **Excel**: `read_sheet(file, start_row=1, max_rows=100)` then `start_row=101`; on wide sheets add `columns_json='["A", "D"]'` to read only the columns you need
+- **Large Excel sheets**: `open_sheet_cursor(file, page_size=100)` then `next_sheet_page(cursor)` continues where the last page ended instead of re-reading from the top
 
 ### Strategy 3: Get Structure First
 - For PDFs: Check `get_pdf_metadata` for page count before extracting
 - For DOCX: Use `get_docx_structure` to see the heading outline
-- For Excel: Use `get_sheet_names` and check row counts
+- For Excel: Use `describe_workbook` to get every sheet's row and column counts in one call
 
 ### Why This Matters
 Large extractions can overflow context limits. By searching first and extracting selectively, you:
@@ -27,6 +27,7 @@ from .docx_tools import (
     extract_docx_with_changes,
     get_docx_comments,
     get_docx_structure,
+    search_docx_corpus,
     search_docx_text,
 )
 from .directed_search_tools import directed_search_document, retrieve_document_segments
@@ -45,12 +46,17 @@ from .pdf_tools import (
 from .xlsx_tools import (
     add_formula,
     analyze_data,
+    close_sheet_cursor,
+    describe_workbook,
     get_formulas,
     get_sheet_names,
+    next_sheet_page,
+    open_sheet_cursor,
     read_sheet,
     recalculate_formulas,
     search_sheet,
     write_cell,
+    write_cells,
 )
 
 # All tools for easy import (read-only + direct write)
@@ -66,7 +72,7 @@ ALL_TOOLS = [
     search_pdf_text,
     directed_search_document,
     retrieve_document_segments,
-    # DOCX (8 tools)
+    # DOCX (9 tools)
     extract_docx_text,
     extract_docx_with_changes,
     get_docx_comments,
@@ -75,12 +81,18 @@ ALL_TOOLS = [
     create_docx,
     apply_tracked_changes,
     search_docx_text,
-    # XLSX (8 tools)
+    search_docx_corpus,
+    # XLSX (13 tools)
     get_sheet_names,
+    describe_workbook,
     read_sheet,
+    open_sheet_cursor,
+    next_sheet_page,
+    close_sheet_cursor,
     get_formulas,
     analyze_data,
     write_cell,
+    write_cells,
     add_formula,
     recalculate_formulas,
     search_sheet,
@@ -100,19 +112,24 @@ ALL_TOOLS_WITH_APPROVAL = [
     search_pdf_text,
     directed_search_document,
     retrieve_document_segments,
-    # DOCX read (5 tools)
+    # DOCX read (6 tools)
     extract_docx_text,
     extract_docx_with_changes,
     get_docx_comments,
     get_docx_structure,
     search_docx_text,
+    search_docx_corpus,
     # DOCX write with approval (3 tools)
     replace_docx_text,
     insert_docx_text,
     delete_docx_text,
-    # XLSX read (5 tools)
+    # XLSX read (9 tools)
     get_sheet_names,
+    describe_workbook,
     read_sheet,
+    open_sheet_cursor,
+    next_sheet_page,
+    close_sheet_cursor,
     get_formulas,
     analyze_data,
     search_sheet,
@@ -143,12 +160,18 @@ __all__ = [
     "create_docx",
     "apply_tracked_changes",
     "search_docx_text",
+    "search_docx_corpus",
     # XLSX
     "get_sheet_names",
+    "describe_workbook",
     "read_sheet",
+    "open_sheet_cursor",
+    "next_sheet_page",
+    "close_sheet_cursor",
     "get_formulas",
     "analyze_data",
     "write_cell",
+    "write_cells",
     "add_formula",
     "recalculate_formulas",
     "search_sheet",
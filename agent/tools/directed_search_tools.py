@@ -13,7 +13,7 @@ from pathlib import Path
 
 from agents import function_tool
 
-from .output_utils import truncate_json_output
+from .output_utils import dumps_json, truncate_json_output
 
 SEGMENT_MAX_CHARS = 1200
 SEGMENT_OVERLAP_CHARS = 200
@@ -307,7 +307,7 @@ def directed_search_document(
         "hits": ranked_hits,
         "tip": "Pass one or more hit selectors to retrieve_document_segments(selectors_json='[...]') for focused extraction.",
     }
-    return truncate_json_output(json.dumps(output, indent=2))
+    return truncate_json_output(dumps_json(output))
 
 
 def _extract_selectors(selectors_json: str) -> list[dict]:
@@ -496,4 +496,4 @@ def retrieve_document_segments(
         "truncated": truncated,
         "results": results,
     }
-    return truncate_json_output(json.dumps(output, indent=2), max_chars=budget)
+    return truncate_json_output(dumps_json(output), max_chars=budget)
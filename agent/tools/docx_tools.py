@@ -3,15 +3,28 @@
 Wraps existing skills/docx/ utilities for use with OpenAI Agents SDK.
 """
 
+import html
 import json
-import sys
+import os
+import re
 import tempfile
 import zipfile
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 
 from agents import function_tool
 
-from .output_utils import truncate_json_output, truncate_output
+from .output_utils import (
+    BoundedStringBuilder,
+    dumps_json,
+    match_context,
+    overlapping_matches,
+    truncate_json_output,
+    truncate_output,
+)
+from .skill_utils import add_skill_path
 
 # Try to import pypandoc (handles pandoc binary location automatically)
 try:
@@ -21,10 +34,227 @@ try:
 except ImportError:
     PYPANDOC_AVAILABLE = False
 
-# Add skills directory to path for imports
-SKILLS_DIR = Path(__file__).parent.parent.parent / "skills"
-sys.path.insert(0, str(SKILLS_DIR / "docx" / "scripts"))
-sys.path.insert(0, str(SKILLS_DIR / "docx" / "ooxml" / "scripts"))
+# WordprocessingML tags in Clark notation
+_W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+_NS = {"w": _W_NS}
+_W_P = f"{{{_W_NS}}}p"
+_W_T = f"{{{_W_NS}}}t"
+_W_PPR = f"{{{_W_NS}}}pPr"
+_W_PSTYLE = f"{{{_W_NS}}}pStyle"
+_W_VAL = f"{{{_W_NS}}}val"
+_W_COMMENT = f"{{{_W_NS}}}comment"
+_W_ID = f"{{{_W_NS}}}id"
+_W_AUTHOR = f"{{{_W_NS}}}author"
+_W_DATE = f"{{{_W_NS}}}date"
+
+# Paragraphs with a w:pPr/w:pStyle child, selected via the parent axis
+_STYLED_PARAGRAPHS = ".//w:pPr/w:pStyle/../.."
+_PARAGRAPH_STYLE = f"{_W_PPR}/{_W_PSTYLE}"
+
+# Outline indent per built-in heading style (Heading1 .. Heading9)
+_HEADING_INDENT = {f"Heading{i}": "  " * (i - 1) for i in range(1, 10)}
+
+# Match snippets reported per paragraph in search results
+_MAX_MATCHES_PER_PARAGRAPH = 5
+
+
+def _para_text(element) -> str:
+    """Return the concatenated w:t text beneath a paragraph (or any element).
+
+    Only w:t runs are joined, so field codes (w:instrText) and deleted text
+    (w:delText) stay out of the result.
+    """
+    return "".join([t.text or "" for t in element.iter(_W_T)])
+
+
+def _validate_input(file_path: str, require_docx: bool = True) -> Path | str:
+    """Validate a tool's input file.
+
+    Args:
+        file_path: Path passed to the tool.
+        require_docx: Whether to reject files without a .docx extension.
+
+    Returns:
+        The file's ``Path`` if it is usable, otherwise an error string that
+        the tool returns as-is.
+    """
+    path = Path(file_path)
+    if not path.exists():
+        return f"Error: File not found: {file_path}"
+
+    if require_docx and path.suffix.lower() != ".docx":
+        return f"Error: Not a DOCX file: {file_path}"
+
+    return path
+
+
+def _docx_paragraph_range(
+    file_path: str | Path, start: int, stop: int | None = None
+) -> tuple[list[str], int]:
+    """Return the texts of paragraphs ``start <= n < stop`` plus the paragraph count.
+
+    Paragraphs are numbered from 1 over non-empty paragraphs, matching
+    search_docx_text(). Text is only assembled for the requested range; every
+    other paragraph is just tested for content and counted.
+    """
+    selected = []
+    para_num = 0
+    with (
+        zipfile.ZipFile(file_path, "r") as zf,
+        zf.open("word/document.xml") as document_xml,
+    ):
+        for para in _iter_paragraphs(document_xml):
+            if para_num + 1 >= start and (stop is None or para_num + 1 < stop):
+                para_text = _para_text(para).strip()
+                if para_text:
+                    selected.append(para_text)
+                    para_num += 1
+            elif any(t.text and not t.text.isspace() for t in para.iter(_W_T)):
+                para_num += 1
+
+    return selected, para_num
+
+
+def _docx_outline(file_path: str | Path) -> list[str]:
+    """Return indented ``"HeadingN: text"`` lines for the headings of a DOCX."""
+    from defusedxml import ElementTree as ET
+
+    with (
+        zipfile.ZipFile(file_path, "r") as zf,
+        zf.open("word/document.xml") as document_xml,
+    ):
+        root = ET.parse(document_xml).getroot()
+
+    structure = []
+    # Only visit paragraphs that carry an explicit style; plain body text
+    # (the vast majority of paragraphs) is skipped inside ElementPath.
+    for para in root.iterfind(_STYLED_PARAGRAPHS, _NS):
+        style = para.find(_PARAGRAPH_STYLE).get(_W_VAL, "")
+        indent = _HEADING_INDENT.get(style)
+        if indent is not None:
+            text = _para_text(para)
+            if text.strip():
+                structure.append(f"{indent}{style}: {text}")
+    return structure
+
+
+def _iter_paragraphs(document_xml) -> Iterator:
+    """Yield every w:p of a streamed document.xml in document order.
+
+    Paragraphs nested inside another (e.g. in a text box) follow their outer
+    paragraph, as with ``.//w:p``, and the outer paragraph keeps their text.
+    Each top-level paragraph is cleared once it and its nested paragraphs
+    have been yielded, so parsed content does not accumulate.
+    """
+    from defusedxml import ElementTree as ET
+
+    depth = 0
+    for event, element in ET.iterparse(document_xml, events=("start", "end")):
+        if element.tag != _W_P:
+            continue
+        if event == "start":
+            depth += 1
+            continue
+        depth -= 1
+        if depth == 0:
+            yield from element.iter(_W_P)
+            element.clear()
+
+
+def _search_docx(
+    file_path: str | Path,
+    query: str,
+    case_sensitive: bool = False,
+    context_chars: int = 100,
+    max_results: int = 20,
+) -> dict:
+    """Search the paragraphs of one DOCX file.
+
+    Overlapping occurrences are counted separately ("aa" occurs twice in
+    "aaa").
+
+    Returns:
+        Dict with ``results`` (per-paragraph matches), ``match_count``,
+        ``paragraph_count`` and ``stopped_early``. After an early stop the
+        counts only cover the paragraphs scanned up to that point.
+    """
+    results = []
+    total_matches = 0
+    para_num = 0
+    stopped_early = False
+    # IGNORECASE matches against the original text, so no lowercased copy of
+    # each paragraph is needed.
+    pattern = re.compile(re.escape(query), 0 if case_sensitive else re.IGNORECASE)
+
+    # Stream paragraphs straight out of the archive and search each one as
+    # it is parsed, so the full paragraph list is never materialized.
+    with (
+        zipfile.ZipFile(file_path, "r") as zf,
+        zf.open("word/document.xml") as document_xml,
+    ):
+        for para in _iter_paragraphs(document_xml):
+            para_text = _para_text(para)
+            if not para_text.strip():
+                continue
+            para_num += 1
+
+            matches = overlapping_matches(pattern, para_text)
+            if len(results) >= max_results:
+                # Result slots are full; only the running count is still needed
+                total_matches += sum(1 for _ in matches)
+            else:
+                # Build context snippets only for the matches that are kept;
+                # the remainder of the paragraph is just counted.
+                para_matches = [
+                    match_context(para_text, match, context_chars)
+                    for match in islice(matches, _MAX_MATCHES_PER_PARAGRAPH)
+                ]
+                if para_matches:
+                    match_count = len(para_matches) + sum(1 for _ in matches)
+                    total_matches += match_count
+                    results.append(
+                        {
+                            "paragraph": para_num,
+                            "match_count": match_count,
+                            "matches": para_matches,
+                        }
+                    )
+
+            # Enough results and a representative match count: stop parsing
+            if len(results) >= max_results and total_matches >= max_results * 10:
+                stopped_early = True
+                break
+
+    return {
+        "results": results,
+        "match_count": total_matches,
+        "paragraph_count": para_num,
+        "stopped_early": stopped_early,
+    }
+
+
+def _process_many(paths: list[str], op) -> list[tuple[str, object]]:
+    """Run ``op(path)`` for every path on a small thread pool.
+
+    File reads and zlib inflation release the GIL, so the I/O side of
+    independent documents overlaps across threads.
+
+    Returns:
+        ``(path, result)`` pairs in input order; ``result`` is the exception
+        instance when ``op`` raised for that path.
+    """
+    if not paths:
+        return []
+
+    max_workers = min(8, os.cpu_count() or 1, len(paths))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(op, path) for path in paths]
+
+    outcomes: list[tuple[str, object]] = []
+    for path, future in zip(paths, futures):
+        error = future.exception()
+        outcomes.append((path, error if error is not None else future.result()))
+    return outcomes
 
 
 @function_tool
@@ -46,54 +276,42 @@ def extract_docx_text(
         - If no paragraph range is provided, returns markdown via pandoc.
         - If range parameters are provided, returns paragraph-targeted plain text.
     """
-    path = Path(file_path)
-    if not path.exists():
-        return f"Error: File not found: {file_path}"
-
-    if path.suffix.lower() != ".docx":
-        return f"Error: Not a DOCX file: {file_path}"
+    path = _validate_input(file_path)
+    if isinstance(path, str):
+        return path
 
     try:
         # Paragraph-level extraction path for targeted retrieval in large documents
         if start_paragraph is not None or max_paragraphs is not None:
-            from defusedxml import ElementTree as ET
-
-            with zipfile.ZipFile(file_path, "r") as zf:
-                document_xml = zf.read("word/document.xml")
-
-            ns = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
-            root = ET.fromstring(document_xml)
-
-            paragraphs = []
-            for para in root.findall(".//w:p", ns):
-                text_elements = para.findall(".//w:t", ns)
-                para_text = "".join(t.text or "" for t in text_elements).strip()
-                if para_text:
-                    paragraphs.append(para_text)
+            start = start_paragraph if start_paragraph and start_paragraph > 0 else 1
+            stop = (
+                start + max_paragraphs
+                if max_paragraphs and max_paragraphs > 0
+                else None
+            )
+            paragraphs, total_paragraphs = _docx_paragraph_range(file_path, start, stop)
 
-            if not paragraphs:
+            if not total_paragraphs:
                 return "No text content found in document."
 
-            start = start_paragraph if start_paragraph and start_paragraph > 0 else 1
-            if start > len(paragraphs):
-                return f"Error: start_paragraph {start} is beyond document length ({len(paragraphs)} paragraphs)."
+            if start > total_paragraphs:
+                return f"Error: start_paragraph {start} is beyond document length ({total_paragraphs} paragraphs)."
 
             if max_paragraphs is not None and max_paragraphs <= 0:
                 return "Error: max_paragraphs must be a positive integer."
 
-            end = len(paragraphs) + 1
-            if max_paragraphs:
-                end = min(start + max_paragraphs, len(paragraphs) + 1)
-
-            selected = []
-            for para_num in range(start, end):
-                para_text = paragraphs[para_num - 1]
-                selected.append(f"=== Paragraph {para_num} ===\n{para_text}")
+            end = start + len(paragraphs)
 
-            pagination_info = (
-                f"[Showing paragraphs {start}-{end - 1} of {len(paragraphs)} total]"
+            # Only the part of the output that survives truncation is kept
+            output = BoundedStringBuilder()
+            output.append(
+                f"[Showing paragraphs {start}-{end - 1} of {total_paragraphs} total]"
             )
-            return truncate_output(f"{pagination_info}\n\n" + "\n\n".join(selected))
+            append = output.append
+            for para_num, para_text in enumerate(paragraphs, start):
+                append(f"\n\n=== Paragraph {para_num} ===\n")
+                append(para_text)
+            return output.build()
 
         if PYPANDOC_AVAILABLE:
             # Use pypandoc which handles finding pandoc automatically
@@ -120,9 +338,9 @@ def extract_docx_with_changes(file_path: str) -> str:
         - Insertions marked with {++text++}
         - Deletions marked with {--text--}
     """
-    path = Path(file_path)
-    if not path.exists():
-        return f"Error: File not found: {file_path}"
+    path = _validate_input(file_path, require_docx=False)
+    if isinstance(path, str):
+        return path
 
     try:
         if PYPANDOC_AVAILABLE:
@@ -150,9 +368,9 @@ def get_docx_comments(file_path: str) -> str:
     """
     from defusedxml import ElementTree as ET
 
-    path = Path(file_path)
-    if not path.exists():
-        return f"Error: File not found: {file_path}"
+    checked = _validate_input(file_path, require_docx=False)
+    if isinstance(checked, str):
+        return checked
 
     try:
         with zipfile.ZipFile(file_path, "r") as zf:
@@ -162,24 +380,15 @@ def get_docx_comments(file_path: str) -> str:
             comments_xml = zf.read("word/comments.xml")
 
         # Parse XML
-        ns = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
         root = ET.fromstring(comments_xml)
 
         comments = []
-        for comment in root.findall(".//w:comment", ns):
-            comment_id = comment.get(
-                "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}id"
-            )
-            author = comment.get(
-                "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}author"
-            )
-            date = comment.get(
-                "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}date"
-            )
+        for comment in root.iter(_W_COMMENT):
+            comment_id = comment.get(_W_ID)
+            author = comment.get(_W_AUTHOR)
+            date = comment.get(_W_DATE)
 
-            # Extract text from all w:t elements
-            text_elements = comment.findall(".//w:t", ns)
-            text = "".join(t.text or "" for t in text_elements)
+            text = _para_text(comment)
 
             comments.append(
                 {"id": comment_id, "author": author, "date": date, "text": text}
@@ -188,7 +397,7 @@ def get_docx_comments(file_path: str) -> str:
         if not comments:
             return "No comments found in document."
 
-        return json.dumps(comments, indent=2)
+        return dumps_json(comments)
     except Exception as e:
         return f"Error extracting comments: {e!s}"
 
@@ -203,38 +412,12 @@ def get_docx_structure(file_path: str) -> str:
     Returns:
         Outline of the document structure showing headings with their levels.
     """
-    from defusedxml import ElementTree as ET
-
-    path = Path(file_path)
-    if not path.exists():
-        return f"Error: File not found: {file_path}"
+    checked = _validate_input(file_path, require_docx=False)
+    if isinstance(checked, str):
+        return checked
 
     try:
-        with zipfile.ZipFile(file_path, "r") as zf:
-            document_xml = zf.read("word/document.xml")
-
-        ns = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
-        root = ET.fromstring(document_xml)
-
-        structure = []
-        for para in root.findall(".//w:p", ns):
-            # Check for heading style
-            pPr = para.find("w:pPr", ns)
-            if pPr is not None:
-                pStyle = pPr.find("w:pStyle", ns)
-                if pStyle is not None:
-                    style = pStyle.get(
-                        "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}val",
-                        "",
-                    )
-                    if style.startswith("Heading"):
-                        # Extract text
-                        text_elements = para.findall(".//w:t", ns)
-                        text = "".join(t.text or "" for t in text_elements)
-                        if text.strip():
-                            level = style.replace("Heading", "")
-                            indent = "  " * (int(level) - 1 if level.isdigit() else 0)
-                            structure.append(f"{indent}{style}: {text}")
+        structure = _docx_outline(file_path)
 
         if not structure:
             return "No heading structure found in document."
@@ -261,28 +444,30 @@ def add_docx_comment(
     Returns:
         Success message or error.
     """
-    path = Path(file_path)
-    if not path.exists():
-        return f"Error: File not found: {file_path}"
+    checked = _validate_input(file_path, require_docx=False)
+    if isinstance(checked, str):
+        return checked
 
     try:
         # Import existing skill classes
-        from document import Document
-        from unpack import unpack_file
+        add_skill_path("docx")
+        from ooxml.scripts.pack import pack_document
+        from ooxml.scripts.unpack import unpack_document
+        from scripts.document import Document
 
         # Create temp directory for unpacked content
         with tempfile.TemporaryDirectory() as tmp_dir:
             # Unpack the docx
-            unpack_file(file_path, tmp_dir)
+            unpack_document(file_path, tmp_dir)
 
             # Create Document instance
             doc = Document(tmp_dir, track_revisions=True, author="Document Analyzer")
 
-            # Find the text node
+            # Find the run holding the text
             editor = doc["word/document.xml"]
-            node = editor.get_node(contains=search_text)
-
-            if node is None:
+            try:
+                node = editor.get_node(tag="w:r", contains=search_text)
+            except ValueError:
                 return f"Error: Could not find text '{search_text}' in document."
 
             # Add comment
@@ -292,9 +477,7 @@ def add_docx_comment(
             doc.save()
 
             # Pack back to docx
-            from pack import pack_file
-
-            pack_file(tmp_dir, output_path)
+            pack_document(tmp_dir, output_path)
 
         return f"Successfully added comment (ID: {comment_id}) to document. Saved to: {output_path}"
     except ImportError as e:
@@ -354,43 +537,46 @@ def apply_tracked_changes(
     Returns:
         Success message or error.
     """
-    path = Path(file_path)
-    if not path.exists():
-        return f"Error: File not found: {file_path}"
+    checked = _validate_input(file_path, require_docx=False)
+    if isinstance(checked, str):
+        return checked
 
     try:
         # Import existing skill classes
-        from document import Document
-        from unpack import unpack_file
+        add_skill_path("docx")
+        from ooxml.scripts.pack import pack_document
+        from ooxml.scripts.unpack import unpack_document
+        from scripts.document import Document
 
         with tempfile.TemporaryDirectory() as tmp_dir:
             # Unpack
-            unpack_file(file_path, tmp_dir)
+            unpack_document(file_path, tmp_dir)
 
             # Create Document with tracked revisions enabled
             doc = Document(tmp_dir, track_revisions=True, author="Document Analyzer")
 
-            # Find the text node
+            # Find the run holding the text
             editor = doc["word/document.xml"]
-            node = editor.get_node(contains=search_text)
-
-            if node is None:
+            try:
+                node = editor.get_node(tag="w:r", contains=search_text)
+            except ValueError:
                 return f"Error: Could not find text '{search_text}' in document."
 
             # Apply tracked deletion and insertion
             editor.suggest_deletion(node)
 
-            # Create insertion with new text
-            new_xml = f'<w:ins w:author="Document Analyzer"><w:r><w:t>{replacement_text}</w:t></w:r></w:ins>'
-            editor.insert_after(node, new_xml)
+            # Create insertion with new text; escape it so &, < and > in the
+            # replacement cannot break (or inject into) the XML fragment
+            escaped_text = html.escape(replacement_text, quote=False)
+            new_xml = f'<w:ins w:author="Document Analyzer"><w:r><w:t>{escaped_text}</w:t></w:r></w:ins>'
+            # suggest_deletion wrapped the run in <w:del>; insert after that
+            editor.insert_after(node.parentNode, new_xml)
 
             # Save
             doc.save()
 
             # Pack
-            from pack import pack_file
-
-            pack_file(tmp_dir, output_path)
+            pack_document(tmp_dir, output_path)
 
         return f"Successfully applied tracked change. '{search_text}' → '{replacement_text}'. Saved to: {output_path}"
     except ImportError as e:
@@ -422,92 +608,145 @@ def search_docx_text(
     Returns:
         JSON with matching paragraphs, match counts, and context snippets.
     """
-    from defusedxml import ElementTree as ET
-
-    path = Path(file_path)
-    if not path.exists():
-        return f"Error: File not found: {file_path}"
-
-    if path.suffix.lower() != ".docx":
-        return f"Error: Not a DOCX file: {file_path}"
+    checked = _validate_input(file_path)
+    if isinstance(checked, str):
+        return checked
 
     if not query or not query.strip():
         return "Error: Search query cannot be empty."
 
     try:
-        with zipfile.ZipFile(file_path, "r") as zf:
-            document_xml = zf.read("word/document.xml")
-
-        ns = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
-        root = ET.fromstring(document_xml)
-
-        results = []
-        total_matches = 0
-        search_query = query if case_sensitive else query.lower()
-
-        # Extract all paragraphs
-        paragraphs = []
-        for para in root.findall(".//w:p", ns):
-            text_elements = para.findall(".//w:t", ns)
-            para_text = "".join(t.text or "" for t in text_elements)
-            if para_text.strip():
-                paragraphs.append(para_text)
-
-        # Search through paragraphs
-        for para_num, para_text in enumerate(paragraphs, 1):
-            search_text = para_text if case_sensitive else para_text.lower()
-
-            # Find all matches in this paragraph
-            start_pos = 0
-            para_matches = []
-            while True:
-                pos = search_text.find(search_query, start_pos)
-                if pos == -1:
-                    break
-
-                total_matches += 1
-
-                # Extract context around the match
-                context_start = max(0, pos - context_chars)
-                context_end = min(len(para_text), pos + len(query) + context_chars)
-                context = para_text[context_start:context_end]
-
-                # Add ellipsis if truncated
-                if context_start > 0:
-                    context = "..." + context
-                if context_end < len(para_text):
-                    context = context + "..."
-
-                para_matches.append(
-                    {
-                        "position": pos,
-                        "context": context.replace("\n", " ").strip(),
-                    }
-                )
-
-                start_pos = pos + 1
-
-            if para_matches and len(results) < max_results:
-                results.append(
-                    {
-                        "paragraph": para_num,
-                        "match_count": len(para_matches),
-                        "matches": para_matches[:5],  # Limit matches per paragraph
-                    }
-                )
+        found = _search_docx(
+            file_path,
+            query,
+            case_sensitive=case_sensitive,
+            context_chars=context_chars,
+            max_results=max_results,
+        )
+        results = found["results"]
+        paragraph_count = found["paragraph_count"]
 
         if not results:
-            return f"No matches found for '{query}' in the document ({len(paragraphs)} paragraphs searched)."
+            return f"No matches found for '{query}' in the document ({paragraph_count} paragraphs searched)."
 
+        # Counts only cover the paragraphs scanned before an early exit
+        stopped_early = found["stopped_early"]
+        matches_key = "matches_scanned" if stopped_early else "total_matches"
+        paragraphs_key = "paragraphs_scanned" if stopped_early else "total_paragraphs"
         output = {
             "query": query,
-            "total_matches": total_matches,
+            matches_key: found["match_count"],
             "paragraphs_with_matches": len(results),
-            "total_paragraphs": len(paragraphs),
+            paragraphs_key: paragraph_count,
             "results": results,
             "tip": "Use extract_docx_text(start_paragraph=N, max_paragraphs=M) for targeted retrieval, or use retrieve_document_segments() with selectors from directed_search_document().",
         }
+        if stopped_early:
+            output["stopped_early"] = True
 
-        return truncate_json_output(json.dumps(output, indent=2))
+        return truncate_json_output(dumps_json(output))
     except Exception as e:
         return f"Error searching DOCX: {e!s}"
+
+
+@function_tool
+def search_docx_corpus(
+    file_paths_json: str,
+    query: str,
+    case_sensitive: bool = False,
+    context_chars: int = 100,
+    max_results_per_file: int = 5,
+) -> str:
+    """Search for text across many DOCX documents in one call.
+
+    Use this instead of calling search_docx_text() once per file when looking
+    for content across a set of documents (e.g. "which contracts mention X?").
+    Documents are searched in parallel.
+
+    Args:
+        file_paths_json: JSON array of DOCX file paths to search.
+                         Example: '["/path/to/a.docx", "/path/to/b.docx"]'
+        query: Text to search for in the documents.
+        case_sensitive: Whether the search should be case-sensitive (default: False).
+        context_chars: Number of characters to show around each match (default: 100).
+        max_results_per_file: Maximum matching paragraphs to return per document
+                              (default: 5).
+
+    Returns:
+        JSON with per-document match counts and context snippets, plus any
+        documents that could not be searched.
+    """
+    try:
+        file_paths = json.loads(file_paths_json)
+    except json.JSONDecodeError as e:
+        return f"Error: Invalid JSON for file_paths: {e!s}"
+
+    if not isinstance(file_paths, list) or not all(
+        isinstance(fp, str) for fp in file_paths
+    ):
+        return "Error: file_paths_json must be a JSON array of path strings."
+
+    if not query or not query.strip():
+        return "Error: Search query cannot be empty."
+
+    errors = []
+    valid_paths = []
+    for fp in file_paths:
+        checked = _validate_input(fp)
+        if isinstance(checked, str):
+            errors.append({"file": fp, "error": checked})
+        else:
+            valid_paths.append(fp)
+
+    def search_one(fp: str) -> dict:
+        return _search_docx(
+            fp,
+            query,
+            case_sensitive=case_sensitive,
+            context_chars=context_chars,
+            max_results=max_results_per_file,
+        )
+
+    documents = []
+    total_matches = 0
+    any_stopped_early = False
+    for fp, found in _process_many(valid_paths, search_one):
+        if isinstance(found, Exception):
+            errors.append({"file": fp, "error": f"Error searching DOCX: {found!s}"})
+            continue
+        if not found["results"]:
+            continue
+
+        # Counts only cover the paragraphs scanned before an early exit
+        stopped_early = found["stopped_early"]
+        any_stopped_early |= stopped_early
+        total_matches += found["match_count"]
+        matches_key = "matches_scanned" if stopped_early else "total_matches"
+        paragraphs_key = "paragraphs_scanned" if stopped_early else "total_paragraphs"
+        document = {
+            "file": fp,
+            matches_key: found["match_count"],
+            "paragraphs_with_matches": len(found["results"]),
+            paragraphs_key: found["paragraph_count"],
+            "results": found["results"],
+        }
+        if stopped_early:
+            document["stopped_early"] = True
+        documents.append(document)
+
+    output = {
+        "query": query,
+        "documents_searched": len(valid_paths),
+        "documents_with_matches": len(documents),
+        "matches_scanned" if any_stopped_early else "total_matches": total_matches,
+        "documents": documents,
+    }
+    if errors:
+        output["errors"] = errors
+    if documents:
+        output["tip"] = (
+            "Use search_docx_text() or extract_docx_text(start_paragraph=N, "
+            "max_paragraphs=M) on a single file for more matches or full text."
+        )
+
+    return truncate_json_output(dumps_json(output))
@@ -4,10 +4,76 @@ Provides truncation functionality to prevent context window overflow
 when tools return large amounts of data (e.g., full PDF text, large tables).
 """
 
+import json
+import re
+from collections.abc import Iterator
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Maximum characters for tool output to prevent context window overflow.
 # Keeping this tighter reduces session growth across multi-turn analysis.
 MAX_TOOL_OUTPUT_CHARS = 25_000
 
+# Default notice appended by truncate_output. The numbers depend only on the
+# output and cap sizes, so the suffix is formatted once and measured exactly.
+_TRUNCATION_SUFFIX = (
+    "\n\n... [OUTPUT TRUNCATED: {truncated:,} more characters. "
+    "Total was {total:,} chars, showing first {shown:,}. "
+    "Use specific page/row filters to reduce output size.]"
+)
+
+# Beyond this multiple of the cap, truncate_json_output only parses payloads
+# whose shape it can truncate structurally.
+_STRUCTURED_PARSE_RATIO = 20
+
+# Placeholder values that mark where truncate_json_output splices content
+# into a pre-serialized envelope (control characters keep them unambiguous).
+_DATA_SLOT = "\x00data\x00"
+_SHOWING_SLOT = "\x00showing\x00"
+
+
+def dumps_json(obj, *, indent: bool = False, default=None) -> str:
+    """Serialize an object as JSON, compact by default.
+
+    Uses orjson when installed (C implementation, several times faster on
+    large result lists) and falls back to the standard library otherwise.
+    Unlike ``json.dumps``, the orjson path emits non-ASCII characters as-is
+    rather than as ``\\uXXXX`` escapes; both forms decode to the same data.
+
+    Args:
+        obj: JSON-serializable object.
+        indent: Pretty-print with 2-space indentation. By default, emit
+                compact single-line JSON with no whitespace between tokens.
+        default: Optional fallback called for objects that are not natively
+                 serializable, as with ``json.dumps``.
+
+    Returns:
+        The JSON document as a string.
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+
+        def orjson_default(value):
+            # orjson does not pass float subclasses through (json does), and
+            # library types such as pypdf's FloatObject subclass float.
+            if isinstance(value, float):
+                return float(value)
+            if default is not None:
+                return default(value)
+            raise TypeError
+
+        return orjson.dumps(obj, default=orjson_default, option=option).decode()
+    if indent:
+        return json.dumps(obj, indent=2, default=default)
+    return json.dumps(obj, separators=(",", ":"), default=default)
+
 
 def truncate_output(
     output: str,
@@ -36,18 +102,115 @@ def truncate_output(
     if len(output) <= max_chars:
         return output
 
-    truncated_chars = len(output) - max_chars
+    return _truncate_with_suffix(output, len(output), max_chars, suffix)
+
+
+def _truncate_with_suffix(
+    head: str, total_chars: int, max_chars: int, suffix: str | None
+) -> str:
+    """Cut ``head`` down and append the truncation suffix.
+
+    ``head`` is the start of an output of ``total_chars`` characters; it must
+    hold at least ``max(max_chars, 100)`` characters.
+    """
     if suffix is None:
-        suffix = (
-            f"\n\n... [OUTPUT TRUNCATED: {truncated_chars:,} more characters. "
-            f"Total was {len(output):,} chars, showing first {max_chars:,}. "
-            "Use specific page/row filters to reduce output size.]"
+        suffix = _TRUNCATION_SUFFIX.format(
+            truncated=total_chars - max_chars, total=total_chars, shown=max_chars
         )
 
     # Reserve space for the suffix, ensuring at least 100 chars of content
     content_limit = max(max_chars - len(suffix), 100)
 
-    return output[:content_limit] + suffix
+    return head[:content_limit] + suffix
+
+
+class BoundedStringBuilder:
+    """Accumulate output pieces, keeping only what can survive truncation.
+
+    Text past the cap is counted but not stored, so a tool can stream an
+    arbitrarily long result (e.g. every page of a PDF) without building the
+    full string first. ``build()`` returns exactly what ``truncate_output``
+    would return for the concatenation of all appended pieces.
+
+    Example:
+        >>> builder = BoundedStringBuilder(max_chars=200)
+        >>> for _ in range(100):
+        ...     builder.append("a" * 60)
+        >>> "TRUNCATED" in builder.build()
+        True
+    """
+
+    def __init__(self, max_chars: int = MAX_TOOL_OUTPUT_CHARS) -> None:
+        self.max_chars = max_chars
+        self.parts: list[str] = []
+        self.length = 0
+        self.overflow = 0
+        # truncate_output keeps at least 100 characters of content
+        self._capacity = max(max_chars, 100)
+
+    def append(self, text: str) -> None:
+        """Add a piece of output, storing only the part that fits."""
+        room = self._capacity - self.length
+        if room <= 0:
+            self.overflow += len(text)
+        elif len(text) <= room:
+            self.parts.append(text)
+            self.length += len(text)
+        else:
+            self.parts.append(text[:room])
+            self.length += room
+            self.overflow += len(text) - room
+
+    def build(self, suffix: str | None = None) -> str:
+        """Join the stored pieces, truncating like ``truncate_output``."""
+        text = "".join(self.parts)
+        total_chars = self.length + self.overflow
+        if total_chars <= self.max_chars:
+            return text
+        return _truncate_with_suffix(text, total_chars, self.max_chars, suffix)
+
+
+def _iter_json_items(items: list, depth: int, indent: bool = True):
+    """Serialize list items one at a time, tracking the array's size.
+
+    Each item is rendered exactly as ``dumps_json`` would render it inside an
+    array nested ``depth`` levels deep, so the pieces can be joined into
+    valid JSON without serializing anything again.
+
+    Args:
+        items: The list to serialize.
+        depth: Nesting depth of the array (0 for a top-level array).
+        indent: Render indented JSON; if False, compact JSON (depth is then
+                irrelevant).
+
+    Yields:
+        ``(piece, size)`` pairs, where ``size`` is the length of the rendered
+        array (brackets included) if it ended after this item. Callers stop
+        iterating once the size exceeds their budget.
+    """
+    if not indent:
+        # "[" + items + "]"
+        size = 2 - 1
+        for item in items:
+            piece = dumps_json(item, indent=False)
+            size += len(piece) + 1  # "," separator (none before the first item)
+            yield piece, size
+        return
+
+    prefix = "  " * (depth + 1)
+    # "[\n" + items + "\n" + closing indent + "]"
+    size = 4 + 2 * depth - 2
+    for item in items:
+        piece = prefix + dumps_json(item, indent=True).replace("\n", "\n" + prefix)
+        size += len(piece) + 2  # ",\n" separator (none before the first item)
+        yield piece, size
+
+
+def _join_json_items(rendered: list[str], depth: int, indent: bool = True) -> str:
+    """Join pieces from ``_iter_json_items`` into a JSON array."""
+    if not indent:
+        return "[" + ",".join(rendered) + "]"
+    return "[\n" + ",\n".join(rendered) + "\n" + "  " * depth + "]"
 
 
 def truncate_json_output(
@@ -58,6 +221,7 @@ def truncate_json_output(
 
     For large JSON arrays, tries to truncate cleanly at array boundaries.
     Falls back to simple truncation if JSON structure can't be preserved.
+    Indented input is re-emitted indented and compact input compact.
 
     Args:
         json_str: JSON string to potentially truncate.
@@ -66,60 +230,140 @@ def truncate_json_output(
     Returns:
         The original JSON if within limits, or truncated with note.
     """
-    import json
-
     if len(json_str) <= max_chars:
         return json_str
 
+    # Parsing a very large payload only pays off if it can be one of the two
+    # shapes truncated structurally below (a list, or a dict with "data");
+    # anything else goes straight to plain truncation.
+    if len(json_str) > max_chars * _STRUCTURED_PARSE_RATIO:
+        head = json_str.lstrip()[:1]
+        if head != "[" and not (head == "{" and '"data"' in json_str):
+            return truncate_output(json_str, max_chars)
+
     # Try to parse and truncate intelligently
     try:
         data = json.loads(json_str)
+        indent = json_str.startswith(("[\n", "{\n"))
 
         # If it's a list, truncate the list
         if isinstance(data, list):
             original_count = len(data)
-            # Binary search for how many items fit
-            lo, hi = 0, len(data)
-            while lo < hi:
-                mid = (lo + hi + 1) // 2
-                test = json.dumps(data[:mid], indent=2)
-                if len(test) <= max_chars - 100:  # Leave room for note
-                    lo = mid
-                else:
-                    hi = mid - 1
+            items = []
+            for piece, size in _iter_json_items(data, depth=0, indent=indent):
+                if size > max_chars - 100:  # Leave room for note
+                    break
+                items.append(piece)
+            lo = len(items)
 
             if lo > 0:
-                truncated = data[:lo]
                 note = f"\n... [Showing {lo} of {original_count} items. Use filters to see more.]"
-                return json.dumps(truncated, indent=2) + note
+                return _join_json_items(items, depth=0, indent=indent) + note
 
         # If it's a dict with a 'data' key that's a list
         if isinstance(data, dict) and "data" in data and isinstance(data["data"], list):
             original_count = len(data["data"])
-            lo, hi = 0, len(data["data"])
-            while lo < hi:
-                mid = (lo + hi + 1) // 2
-                test_data = dict(data)
-                test_data["data"] = data["data"][:mid]
-                test_data["truncated"] = True
-                test_data["showing"] = mid
-                test_data["total"] = original_count
-                test = json.dumps(test_data, indent=2)
-                if len(test) <= max_chars:
-                    lo = mid
-                else:
-                    hi = mid - 1
+            # Serialize the envelope once, with markers where the array and
+            # the "showing" count go, then grow the array one serialized item
+            # at a time and splice both in.
+            envelope = dict(data)
+            envelope["data"] = _DATA_SLOT
+            envelope["truncated"] = True
+            envelope["showing"] = _SHOWING_SLOT
+            envelope["total"] = original_count
+            template = dumps_json(envelope, indent=indent)
+            data_slot = dumps_json(_DATA_SLOT, indent=indent)
+            showing_slot = dumps_json(_SHOWING_SLOT, indent=indent)
+            overhead = len(template) - len(data_slot) - len(showing_slot)
+
+            items = []
+            for piece, size in _iter_json_items(data["data"], depth=1, indent=indent):
+                if overhead + size + len(str(len(items) + 1)) > max_chars:
+                    break
+                items.append(piece)
+            lo = len(items)
 
             if lo > 0:
-                truncated_data = dict(data)
-                truncated_data["data"] = data["data"][:lo]
-                truncated_data["truncated"] = True
-                truncated_data["showing"] = lo
-                truncated_data["total"] = original_count
-                return json.dumps(truncated_data, indent=2)
+                return template.replace(showing_slot, str(lo), 1).replace(
+                    data_slot, _join_json_items(items, depth=1, indent=indent), 1
+                )
 
     except (json.JSONDecodeError, TypeError, KeyError):
         pass
 
     # Fallback to simple truncation
     return truncate_output(json_str, max_chars)
+
+
+def truncate_ndjson_output(
+    ndjson: str,
+    max_chars: int = MAX_TOOL_OUTPUT_CHARS,
+) -> str:
+    """Truncate newline-delimited JSON at a record boundary.
+
+    Every kept line is a complete JSON record, so no parsing or
+    re-serialization is needed to keep the output valid.
+
+    Args:
+        ndjson: One JSON record per line.
+        max_chars: Maximum number of characters allowed.
+
+    Returns:
+        The original output if within limits, or the leading whole records
+        with a note.
+    """
+    if len(ndjson) <= max_chars:
+        return ndjson
+
+    # Last line break that still leaves room for the note
+    cut = ndjson.rfind("\n", 0, max_chars - 100 + 1)
+    if cut <= 0:
+        # Not even one whole record fits
+        return truncate_output(ndjson, max_chars)
+
+    shown = ndjson.count("\n", 0, cut) + 1
+    total = ndjson.count("\n", cut) + shown
+    note = f"\n... [Showing {shown} of {total} items. Use filters to see more.]"
+    return ndjson[:cut] + note
+
+
+def match_context(text: str, match: re.Match, context_chars: int) -> dict:
+    """Describe one search match with surrounding context.
+
+    Shared by the PDF and DOCX text searches so their snippets look alike.
+
+    Args:
+        text: Text the match was found in.
+        match: The regex match.
+        context_chars: Characters of context to keep on each side.
+
+    Returns:
+        ``{"position", "context"}``, with "..." marking cut-off context and
+        newlines flattened to spaces.
+    """
+    context_start = max(0, match.start() - context_chars)
+    context_end = min(len(text), match.end() + context_chars)
+    context = text[context_start:context_end]
+
+    # Add ellipsis if truncated
+    if context_start > 0:
+        context = "..." + context
+    if context_end < len(text):
+        context = context + "..."
+
+    return {
+        "position": match.start(),
+        "context": context.replace("\n", " ").strip(),
+    }
+
+
+def overlapping_matches(pattern: re.Pattern, text: str) -> Iterator[re.Match]:
+    """Yield matches of a pattern starting at every position.
+
+    Unlike ``finditer``, overlapping occurrences are reported separately
+    ("aa" occurs twice in "aaa"), as the text searches count them.
+    """
+    match = pattern.search(text)
+    while match:
+        yield match
+        match = pattern.search(text, match.start() + 1)
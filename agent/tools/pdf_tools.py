@@ -3,18 +3,277 @@
 Wraps existing skills/pdf/ utilities for use with OpenAI Agents SDK.
 """
 
+import functools
+import inspect
+import io
 import json
-import sys
-import tempfile
+import re
+import threading
+from collections import Counter, OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from itertools import islice
 from pathlib import Path
 
 from agents import function_tool
 
-from .output_utils import truncate_json_output, truncate_output
+from .output_utils import (
+    BoundedStringBuilder,
+    dumps_json,
+    match_context,
+    overlapping_matches,
+    truncate_json_output,
+    truncate_ndjson_output,
+)
+from .skill_utils import add_skill_path
+
+# Try to import PyMuPDF (C-based MuPDF binding, much faster for plain text)
+try:
+    import pymupdf
+
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+
+# Matches with context kept per page in search results
+_MAX_MATCHES_PER_PAGE = 5
+# Files up to this size are kept in memory between calls, and pdfplumber
+# reads them into memory in one go
+_BUFFER_MAX_BYTES = 64 * 1024 * 1024
+
+# Parsed pypdf readers, most recently used last, keyed by (path, mtime, size)
+# and bounded by the total size of the files behind them
+_READER_CACHE_MAX_BYTES = 256 * 1024 * 1024
+_reader_cache: OrderedDict[tuple[str, int, int], tuple] = OrderedDict()
+_reader_cache_bytes = 0
+_reader_cache_lock = threading.Lock()
+
+# Extracted page texts by page number, most recently used document last,
+# bounded by total size
+_PAGE_TEXT_CACHE_MAX_CHARS = 10_000_000
+_page_text_cache: OrderedDict[tuple[str, int, int], dict] = OrderedDict()
+_page_text_cache_chars = 0
+_page_text_cache_lock = threading.Lock()
+
+# Results of read-only tools, most recently used last, bounded by total size
+_RESULT_CACHE_MAX_CHARS = 10_000_000
+_result_cache: OrderedDict[tuple, str] = OrderedDict()
+_result_cache_chars = 0
+_result_cache_lock = threading.Lock()
+
+
+def _file_state_key(file_path: str) -> tuple[str, int, int]:
+    """Identify a file's current state by resolved path, mtime and size.
+
+    Raises OSError if the file cannot be stat'ed.
+    """
+    path = Path(file_path).resolve()
+    stat = path.stat()
+    return str(path), stat.st_mtime_ns, stat.st_size
+
+
+@contextmanager
+def _cached_reader(file_path: str) -> Iterator:
+    """Yield a pypdf ``PdfReader`` for the file, reusing an earlier parse.
+
+    Readers are cached by path, modification time and size, so an edited
+    file is parsed afresh. pypdf holds the whole file in memory, so the
+    cache is bounded by the total size of the cached files, and files over
+    ``_BUFFER_MAX_BYTES`` are parsed for the call and not kept. Tools run in
+    worker threads and a reader resolves objects lazily from one shared
+    stream, so each reader is used by one caller at a time.
+    """
+    global _reader_cache_bytes
+
+    from pypdf import PdfReader
+
+    key = _file_state_key(file_path)
+    size = key[2]
+    if size > _BUFFER_MAX_BYTES:
+        yield PdfReader(file_path)
+        return
+
+    with _reader_cache_lock:
+        entry = _reader_cache.get(key)
+        if entry is not None:
+            _reader_cache.move_to_end(key)
+
+    if entry is None:
+        entry = (PdfReader(file_path), threading.Lock())
+        with _reader_cache_lock:
+            # Another thread may have parsed the same file meanwhile
+            if key in _reader_cache:
+                entry = _reader_cache[key]
+            else:
+                _reader_cache[key] = entry
+                _reader_cache_bytes += size
+            _reader_cache.move_to_end(key)
+            while _reader_cache_bytes > _READER_CACHE_MAX_BYTES:
+                (_, _, evicted_size), _ = _reader_cache.popitem(last=False)
+                _reader_cache_bytes -= evicted_size
+
+    reader, lock = entry
+    with lock:
+        yield reader
+
+
+def _cached_tool(func):
+    """Memoize a read-only PDF tool on its arguments and the file's state.
+
+    Agents often repeat a call with identical arguments within a session;
+    the repeat is served from memory instead of re-parsing the PDF. Keys
+    include the file's modification time and size, so an edited file is
+    processed afresh. Error results are never cached, and the cache is
+    bounded by the total size of the stored results.
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        global _result_cache_chars
+
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        file_path = bound.arguments["file_path"]
+        try:
+            key = (
+                func.__name__,
+                *_file_state_key(file_path),
+                tuple(bound.arguments.items()),
+            )
+        except OSError:
+            return func(*args, **kwargs)
 
-# Add skills directory to path for imports
-SKILLS_DIR = Path(__file__).parent.parent.parent / "skills"
-sys.path.insert(0, str(SKILLS_DIR / "pdf" / "scripts"))
+        with _result_cache_lock:
+            result = _result_cache.get(key)
+            if result is not None:
+                _result_cache.move_to_end(key)
+                return result
+
+        result = func(*args, **kwargs)
+        if result.startswith("Error") or len(result) > _RESULT_CACHE_MAX_CHARS:
+            return result
+
+        with _result_cache_lock:
+            if key not in _result_cache:
+                _result_cache[key] = result
+                _result_cache_chars += len(result)
+                while _result_cache_chars > _RESULT_CACHE_MAX_CHARS:
+                    _, evicted = _result_cache.popitem(last=False)
+                    _result_cache_chars -= len(evicted)
+        return result
+
+    return wrapper
+
+
+def _plumber_source(file_path: str):
+    """Return what to hand ``pdfplumber.open`` for a file.
+
+    pdfminer parses through many small seeks and reads; on network mounts
+    each one is a round trip, so files up to ``_BUFFER_MAX_BYTES`` are read
+    in a single call and parsed from memory. Larger files are opened by path.
+    """
+    if Path(file_path).stat().st_size > _BUFFER_MAX_BYTES:
+        return file_path
+    with open(file_path, "rb") as f:
+        return io.BytesIO(f.read())
+
+
+def _plumber_page_text(page) -> str | None:
+    """Extract a pdfplumber page's text, then release its parsed objects.
+
+    pdfplumber caches every parsed object (curves, rects, chars) on the page
+    for the life of the PDF; on graphics-heavy documents that cache dwarfs
+    the text itself, so it is dropped as soon as the text is out.
+    """
+    text = page.extract_text()
+    page.close()
+    return text
+
+
+def _iter_page_texts(pdf, page_numbers: list[int]):
+    """Yield the extracted text of each page (1-indexed), in order.
+
+    ``pdf`` is an open PyMuPDF document when PyMuPDF is available, otherwise
+    an open pdfplumber PDF. Pages are extracted one at a time on it; a process
+    pool measured slower, as worker start-up and re-opening the file in each
+    worker cost more than the layout analysis they split.
+    """
+    if PYMUPDF_AVAILABLE:
+        for page_num in page_numbers:
+            yield pdf[page_num - 1].get_text().rstrip()
+        return
+
+    for page_num in page_numbers:
+        yield _plumber_page_text(pdf.pages[page_num - 1])
+
+
+def _cache_page_text(key: tuple, texts: dict, page_num: int, text: str | None):
+    """Store one extracted page, evicting least recently used documents.
+
+    Nothing is stored once ``texts`` has itself been evicted, so a document
+    larger than the whole cache is simply not kept.
+    """
+    global _page_text_cache_chars
+
+    with _page_text_cache_lock:
+        if _page_text_cache.get(key) is not texts or page_num in texts:
+            return
+        texts[page_num] = text
+        _page_text_cache_chars += len(text or "")
+        while _page_text_cache_chars > _PAGE_TEXT_CACHE_MAX_CHARS:
+            _, evicted = _page_text_cache.popitem(last=False)
+            _page_text_cache_chars -= sum(len(t or "") for t in evicted.values())
+
+
+def _iter_cached_page_texts(pdf, file_path: str, page_numbers: list[int]):
+    """Like ``_iter_page_texts``, but reuse pages extracted by earlier calls.
+
+    Agents often search one document for several queries in a row, or
+    search it and then extract pages; each page is extracted once per file
+    state (path, modification time and size) and then served from memory.
+    The cache is bounded by the total size of the stored texts.
+    """
+    key = _file_state_key(file_path)
+    with _page_text_cache_lock:
+        cached = _page_text_cache.setdefault(key, {})
+        _page_text_cache.move_to_end(key)
+
+    # Work from a local view: the shared dict may be evicted, or filled by a
+    # concurrent call, while this one runs. Extracted pages are kept locally
+    # only if they are asked for again.
+    texts = {n: cached[n] for n in page_numbers if n in cached}
+    repeated = {n for n, count in Counter(page_numbers).items() if count > 1}
+    pending = [n for n in dict.fromkeys(page_numbers) if n not in texts]
+    extracted = _iter_page_texts(pdf, pending)
+    try:
+        for page_num in page_numbers:
+            if page_num in texts:
+                yield texts[page_num]
+                continue
+            text = next(extracted)
+            _cache_page_text(key, cached, page_num, text)
+            if page_num in repeated:
+                texts[page_num] = text
+            yield text
+    finally:
+        extracted.close()
+
+
+def _open_text_pdf(file_path: str):
+    """Open a PDF for plain-text extraction with ``_iter_page_texts``.
+
+    Plain text needs no layout analysis, so PyMuPDF is preferred when
+    present. Returns the open document and its page count.
+    """
+    if PYMUPDF_AVAILABLE:
+        pdf = pymupdf.open(file_path)
+        return pdf, pdf.page_count
+
+    import pdfplumber
+
+    pdf = pdfplumber.open(_plumber_source(file_path))
+    return pdf, len(pdf.pages)
 
 
 @function_tool
@@ -41,13 +300,10 @@ def extract_pdf_text(
     Returns:
         Extracted text content from the PDF, organized by page.
     """
-    import pdfplumber
-
-    path = Path(file_path)
-    if not path.exists():
+    if not Path(file_path).is_file():
         return f"Error: File not found: {file_path}"
 
-    if path.suffix.lower() != ".pdf":
+    if Path(file_path).suffix.lower() != ".pdf":
         return f"Error: Not a PDF file: {file_path}"
 
     # Parse page numbers if provided
@@ -59,10 +315,12 @@ def extract_pdf_text(
             return f"Error: Invalid JSON for page_numbers: {page_numbers_json}"
 
     try:
-        text_content = []
-        with pdfplumber.open(file_path) as pdf:
-            total_pages = len(pdf.pages)
-
+        # Pages stream into a bounded builder, so text past the output cap is
+        # counted for the truncation notice but never held in memory.
+        output = BoundedStringBuilder()
+        pages_written = 0
+        pdf, total_pages = _open_text_pdf(file_path)
+        with pdf:
             # Determine which pages to process
             if page_numbers:
                 # Explicit page list takes priority
@@ -75,35 +333,41 @@ def extract_pdf_text(
                     end = min(start + max_pages, total_pages + 1)
                 pages_to_process = list(range(start, end))
 
+            # Add pagination info to help agent navigate
+            if pages_to_process:
+                output.append(
+                    f"[Showing pages {pages_to_process[0]}-{pages_to_process[-1]} of {total_pages} total]"
+                )
+            output.append("\n\n")
+
+            page_texts = _iter_cached_page_texts(
+                pdf,
+                file_path,
+                [n for n in pages_to_process if 1 <= n <= total_pages],
+            )
             for page_num in pages_to_process:
                 if 1 <= page_num <= total_pages:
-                    page = pdf.pages[page_num - 1]
-                    text = page.extract_text()
-                    if text:
-                        text_content.append(f"=== Page {page_num} ===\n{text}")
+                    text = next(page_texts)
+                    if not text:
+                        continue
+                    entry = f"=== Page {page_num} ===\n{text}"
                 else:
-                    text_content.append(
-                        f"=== Page {page_num} === (invalid page number)"
-                    )
-
-        # Add pagination info to help agent navigate
-        pagination_info = (
-            f"[Showing pages {pages_to_process[0]}-{pages_to_process[-1]} of {total_pages} total]"
-            if pages_to_process
-            else ""
-        )
+                    entry = f"=== Page {page_num} === (invalid page number)"
 
-        result = (
-            f"{pagination_info}\n\n" + "\n\n".join(text_content)
-            if text_content
-            else "No text content found in PDF."
-        )
-        return truncate_output(result)
+                if pages_written:
+                    output.append("\n\n")
+                output.append(entry)
+                pages_written += 1
+
+        if not pages_written:
+            return "No text content found in PDF."
+        return output.build()
     except Exception as e:
         return f"Error extracting PDF text: {e!s}"
 
 
 @function_tool
+@_cached_tool
 def extract_pdf_tables(file_path: str, page_number: int | None = None) -> str:
     """Extract tables from a PDF file as structured data.
 
@@ -113,46 +377,101 @@ def extract_pdf_tables(file_path: str, page_number: int | None = None) -> str:
                      If not provided, extracts tables from all pages.
 
     Returns:
-        JSON string containing extracted tables with their page numbers.
+        Newline-delimited JSON: one table per line with its page number,
+        table index, size, and cell data.
     """
     import pdfplumber
 
-    path = Path(file_path)
-    if not path.exists():
+    if not Path(file_path).is_file():
         return f"Error: File not found: {file_path}"
 
     try:
-        all_tables = []
-        with pdfplumber.open(file_path) as pdf:
-            pages_to_process = (
-                [page_number] if page_number else list(range(1, len(pdf.pages) + 1))
-            )
-
-            for page_num in pages_to_process:
-                if 1 <= page_num <= len(pdf.pages):
-                    page = pdf.pages[page_num - 1]
-                    tables = page.extract_tables()
-                    for i, table in enumerate(tables):
-                        if table:
-                            all_tables.append(
+        # One compact JSON line per table, so truncation can cut at a line
+        # boundary instead of re-parsing a pretty-printed array.
+        table_lines = []
+        # For a single page, only that page is loaded (out-of-range numbers
+        # simply yield no pages)
+        open_kwargs = {"pages": [page_number]} if page_number else {}
+        with pdfplumber.open(_plumber_source(file_path), **open_kwargs) as pdf:
+            for page in pdf.pages:
+                # Table detection has to parse the whole page either way;
+                # release the parsed objects once its tables are out, as
+                # _plumber_page_text does for text.
+                tables = page.extract_tables()
+                page.close()
+                for i, table in enumerate(tables):
+                    if table:
+                        table_lines.append(
+                            dumps_json(
                                 {
-                                    "page": page_num,
+                                    "page": page.page_number,
                                     "table_index": i + 1,
                                     "rows": len(table),
                                     "columns": len(table[0]) if table else 0,
                                     "data": table,
                                 }
                             )
+                        )
 
-        if not all_tables:
+        if not table_lines:
             return "No tables found in PDF."
 
-        return truncate_json_output(json.dumps(all_tables, indent=2))
+        return truncate_ndjson_output("\n".join(table_lines))
     except Exception as e:
         return f"Error extracting PDF tables: {e!s}"
 
 
+def _pdf_date(text: str | None) -> str | None:
+    """Render a PDF date string ("D:YYYYMMDDHHmmSS+HH'mm'") as pypdf does.
+
+    The string is read back through pypdf's ``DocumentInformation``, so both
+    paths of get_pdf_metadata report the same strings; unparseable dates are
+    returned as stored.
+    """
+    from pypdf import DocumentInformation
+    from pypdf.generic import NameObject, TextStringObject
+
+    if not text:
+        return None
+    info = DocumentInformation()
+    info[NameObject("/CreationDate")] = TextStringObject(text)
+    try:
+        return str(info.creation_date)
+    except ValueError:
+        return text
+
+
+def _pymupdf_metadata(file_path: str) -> dict | None:
+    """Read the Info dictionary and page count with PyMuPDF.
+
+    MuPDF reads the trailer and cross-reference table from disk on demand,
+    where pypdf first reads the whole file into memory. Returns None for
+    files that are encrypted or not PDFs, leaving them to the pypdf path.
+    """
+    try:
+        doc = pymupdf.open(file_path)
+    except Exception:
+        return None
+    with doc:
+        if not doc.is_pdf or doc.needs_pass:
+            return None
+        meta = doc.metadata or {}
+        page_count = doc.page_count
+
+    return {
+        "title": meta.get("title") or None,
+        "author": meta.get("author") or None,
+        "subject": meta.get("subject") or None,
+        "creator": meta.get("creator") or None,
+        "producer": meta.get("producer") or None,
+        "creation_date": _pdf_date(meta.get("creationDate")),
+        "modification_date": _pdf_date(meta.get("modDate")),
+        "page_count": page_count,
+    }
+
+
 @function_tool
+@_cached_tool
 def get_pdf_metadata(file_path: str) -> str:
     """Get metadata from a PDF file (title, author, creation date, page count).
 
@@ -162,15 +481,23 @@ def get_pdf_metadata(file_path: str) -> str:
     Returns:
         JSON string containing PDF metadata.
     """
-    from pypdf import PdfReader
-
-    path = Path(file_path)
-    if not path.exists():
+    if not Path(file_path).is_file():
         return f"Error: File not found: {file_path}"
 
+    if PYMUPDF_AVAILABLE:
+        metadata = _pymupdf_metadata(file_path)
+        if metadata is not None:
+            return dumps_json(metadata, default=str)
+
     try:
-        reader = PdfReader(file_path)
-        meta = reader.metadata
+        with _cached_reader(file_path) as reader:
+            meta = reader.metadata
+            # /Count on the page tree root holds the total, so the tree
+            # doesn't have to be flattened just to count its leaves
+            try:
+                page_count = int(reader.trailer["/Root"]["/Pages"]["/Count"])
+            except (KeyError, TypeError, ValueError):
+                page_count = len(reader.pages)
 
         metadata = {
             "title": meta.title if meta else None,
@@ -184,15 +511,16 @@ def get_pdf_metadata(file_path: str) -> str:
             "modification_date": (
                 str(meta.modification_date) if meta and meta.modification_date else None
             ),
-            "page_count": len(reader.pages),
+            "page_count": page_count,
         }
 
-        return json.dumps(metadata, indent=2, default=str)
+        return dumps_json(metadata, default=str)
     except Exception as e:
         return f"Error getting PDF metadata: {e!s}"
 
 
 @function_tool
+@_cached_tool
 def get_pdf_form_fields(file_path: str) -> str:
     """Extract fillable form field information from a PDF.
 
@@ -204,29 +532,25 @@ def get_pdf_form_fields(file_path: str) -> str:
     Returns:
         JSON string containing form field definitions (field names, types, pages, values).
     """
-    from pypdf import PdfReader
-
-    path = Path(file_path)
-    if not path.exists():
+    if not Path(file_path).is_file():
         return f"Error: File not found: {file_path}"
 
     try:
         # Import from existing skill
+        add_skill_path("pdf/scripts")
         from extract_form_field_info import get_field_info
 
-        reader = PdfReader(file_path)
-        fields = get_field_info(reader)
+        with _cached_reader(file_path) as reader:
+            fields = get_field_info(reader)
 
         if not fields:
             return "No fillable form fields found in PDF."
 
-        return json.dumps(fields, indent=2)
+        return dumps_json(fields)
     except ImportError:
         # Fallback if skill not available
-        from pypdf import PdfReader
-
-        reader = PdfReader(file_path)
-        fields = reader.get_fields()
+        with _cached_reader(file_path) as reader:
+            fields = reader.get_fields()
 
         if not fields:
             return "No fillable form fields found in PDF."
@@ -240,7 +564,7 @@ def get_pdf_form_fields(file_path: str) -> str:
             }
             field_info.append(info)
 
-        return json.dumps(field_info, indent=2)
+        return dumps_json(field_info)
     except Exception as e:
         return f"Error extracting form fields: {e!s}"
 
@@ -260,10 +584,7 @@ def fill_pdf_form(file_path: str, field_values_json: str, output_path: str) -> s
     Returns:
         Success message with output path, or error message.
     """
-    from pypdf import PdfReader
-
-    path = Path(file_path)
-    if not path.exists():
+    if not Path(file_path).is_file():
         return f"Error: File not found: {file_path}"
 
     try:
@@ -274,42 +595,42 @@ def fill_pdf_form(file_path: str, field_values_json: str, output_path: str) -> s
 
     try:
         # Get field info to map field names to pages
+        add_skill_path("pdf/scripts")
         from extract_form_field_info import get_field_info
+        from fill_fillable_fields import (
+            fill_pdf_fields_from_list,
+            monkeypatch_pydpf_method,
+        )
 
-        reader = PdfReader(file_path)
-        existing_fields = get_field_info(reader)
-        fields_by_id = {f["field_id"]: f for f in existing_fields}
-
-        # Validate field IDs
-        invalid_fields = [fid for fid in field_values.keys() if fid not in fields_by_id]
-        if invalid_fields:
-            return f"Error: Invalid field IDs: {invalid_fields}. Valid IDs: {list(fields_by_id.keys())}"
-
-        # Create fields list with page info
-        fields_to_fill = []
-        for field_id, value in field_values.items():
-            field_info = fields_by_id[field_id]
-            fields_to_fill.append(
-                {
-                    "field_id": field_id,
-                    "page": field_info["page"],
-                    "value": value,
-                }
-            )
-
-        # Write to temp JSON file and use existing skill
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as tmp:
-            json.dump(fields_to_fill, tmp)
-            tmp_path = tmp.name
+        # The fill reuses the reader parsed for the field lookup
+        with _cached_reader(file_path) as reader:
+            existing_fields = get_field_info(reader)
+            fields_by_id = {f["field_id"]: f for f in existing_fields}
+
+            # Validate field IDs
+            invalid_fields = [
+                fid for fid in field_values.keys() if fid not in fields_by_id
+            ]
+            if invalid_fields:
+                return f"Error: Invalid field IDs: {invalid_fields}. Valid IDs: {list(fields_by_id.keys())}"
+
+            # Create fields list with page info
+            fields_to_fill = []
+            for field_id, value in field_values.items():
+                field_info = fields_by_id[field_id]
+                fields_to_fill.append(
+                    {
+                        "field_id": field_id,
+                        "page": field_info["page"],
+                        "value": value,
+                    }
+                )
 
-        try:
             # Apply monkeypatch for pypdf bug
-            from fill_fillable_fields import fill_pdf_fields, monkeypatch_pydpf_method
-
             monkeypatch_pydpf_method()
-            fill_pdf_fields(file_path, tmp_path, output_path)
-        finally:
-            Path(tmp_path).unlink()
+            fill_pdf_fields_from_list(
+                file_path, fields_to_fill, output_path, reader=reader
+            )
 
         return f"Successfully filled PDF form. Output saved to: {output_path}"
     except Exception as e:
@@ -328,30 +649,61 @@ def merge_pdfs(file_paths_json: str, output_path: str) -> str:
     Returns:
         Success message with page counts, or error message.
     """
-    from pypdf import PdfReader, PdfWriter
-
     try:
         file_paths = json.loads(file_paths_json)
     except json.JSONDecodeError as e:
         return f"Error: Invalid JSON for file_paths: {e!s}"
 
-    # Validate all files exist
-    for fp in file_paths:
-        if not Path(fp).exists():
-            return f"Error: File not found: {fp}"
+    if not file_paths:
+        return "Error: No PDF files given to merge."
+
+    # Validate all files exist, reporting every missing one at once
+    missing = [fp for fp in file_paths if not Path(fp).is_file()]
+    if missing:
+        return f"Error: Files not found: {', '.join(missing)}"
 
     try:
-        writer = PdfWriter()
         page_counts = []
 
-        for pdf_file in file_paths:
-            reader = PdfReader(pdf_file)
-            page_counts.append(len(reader.pages))
-            for page in reader.pages:
-                writer.add_page(page)
+        if PYMUPDF_AVAILABLE:
+            # MuPDF grafts pages and their resources in C; bookmarks are not
+            # carried over by insert_pdf, so they are rebuilt with the pages
+            # shifted by the merge offset. Entries without a destination in
+            # the file have page -1 and keep it.
+            with pymupdf.open() as merged:
+                toc = []
+                for pdf_file in file_paths:
+                    with pymupdf.open(pdf_file) as src:
+                        offset = merged.page_count
+                        merged.insert_pdf(src)
+                        toc.extend(
+                            [level, title, page + offset if page > 0 else page]
+                            for level, title, page in src.get_toc()
+                        )
+                        page_counts.append(src.page_count)
+                if toc:
+                    try:
+                        merged.set_toc(toc)
+                    except ValueError:
+                        # A malformed source outline (e.g. one that skips a
+                        # level) should not sink the merge; keep the pages
+                        pass
+                # garbage=1 drops unused objects; higher levels also hunt for
+                # duplicate objects, which is slow on large merges
+                merged.save(output_path, garbage=1, deflate=True)
+        else:
+            from pypdf import PdfWriter
 
-        with open(output_path, "wb") as output:
-            writer.write(output)
+            writer = PdfWriter()
+            for pdf_file in file_paths:
+                # append() transplants the input's pages in one pass; the page
+                # count falls out of the writer instead of a separate reader.
+                pages_before = len(writer.pages)
+                writer.append(pdf_file)
+                page_counts.append(len(writer.pages) - pages_before)
+
+            with open(output_path, "wb") as output:
+                writer.write(output)
 
         total_pages = sum(page_counts)
         details = ", ".join(
@@ -373,27 +725,38 @@ def split_pdf(file_path: str, output_dir: str) -> str:
     Returns:
         Success message with number of pages created, or error message.
     """
-    from pypdf import PdfReader, PdfWriter
-
     path = Path(file_path)
-    if not path.exists():
+    if not path.is_file():
         return f"Error: File not found: {file_path}"
 
     out_dir = Path(output_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
 
     try:
-        reader = PdfReader(file_path)
         base_name = path.stem
         created_files = []
 
-        for i, page in enumerate(reader.pages):
-            writer = PdfWriter()
-            writer.add_page(page)
-            output_file = out_dir / f"{base_name}_page_{i + 1}.pdf"
-            with open(output_file, "wb") as output:
-                writer.write(output)
-            created_files.append(str(output_file))
+        if PYMUPDF_AVAILABLE:
+            # Copy pages out of the once-parsed source; garbage=3 drops the
+            # shared resources each single-page file does not reference.
+            with pymupdf.open(file_path) as src:
+                for i in range(src.page_count):
+                    output_file = out_dir / f"{base_name}_page_{i + 1}.pdf"
+                    with pymupdf.open() as dst:
+                        dst.insert_pdf(src, from_page=i, to_page=i)
+                        dst.save(output_file, garbage=3, deflate=True)
+                    created_files.append(str(output_file))
+        else:
+            from pypdf import PdfWriter
+
+            with _cached_reader(file_path) as reader:
+                for i, page in enumerate(reader.pages, 1):
+                    writer = PdfWriter()
+                    writer.add_page(page)
+                    output_file = out_dir / f"{base_name}_page_{i}.pdf"
+                    with open(output_file, "wb") as output:
+                        writer.write(output)
+                    created_files.append(str(output_file))
 
         return f"Successfully split PDF into {len(created_files)} pages in {output_dir}"
     except Exception as e:
@@ -424,13 +787,10 @@ def search_pdf_text(
         JSON with matching pages, match counts, and context snippets.
         Use the page numbers with extract_pdf_text(page_numbers_json='[...]') to get full content.
     """
-    import pdfplumber
-
-    path = Path(file_path)
-    if not path.exists():
+    if not Path(file_path).is_file():
         return f"Error: File not found: {file_path}"
 
-    if path.suffix.lower() != ".pdf":
+    if Path(file_path).suffix.lower() != ".pdf":
         return f"Error: Not a PDF file: {file_path}"
 
     if not query or not query.strip():
@@ -441,71 +801,69 @@ def search_pdf_text(
         total_matches = 0
         pages_with_matches = set()
 
-        search_query = query if case_sensitive else query.lower()
-
-        with pdfplumber.open(file_path) as pdf:
-            total_pages = len(pdf.pages)
+        stopped_early = False
+        # IGNORECASE matches against the original text, so no lowercased copy
+        # of each page is needed.
+        pattern = re.compile(re.escape(query), 0 if case_sensitive else re.IGNORECASE)
 
-            for page_num, page in enumerate(pdf.pages, 1):
-                text = page.extract_text()
+        pdf, total_pages = _open_text_pdf(file_path)
+        with pdf:
+            page_texts = _iter_cached_page_texts(
+                pdf, file_path, list(range(1, total_pages + 1))
+            )
+            for page_num, text in enumerate(page_texts, 1):
                 if not text:
                     continue
 
-                search_text = text if case_sensitive else text.lower()
-
-                # Find all matches on this page
-                start_pos = 0
-                page_matches = []
-                while True:
-                    pos = search_text.find(search_query, start_pos)
-                    if pos == -1:
-                        break
-
-                    total_matches += 1
-                    pages_with_matches.add(page_num)
-
-                    # Extract context around the match
-                    context_start = max(0, pos - context_chars)
-                    context_end = min(len(text), pos + len(query) + context_chars)
-                    context = text[context_start:context_end]
-
-                    # Add ellipsis if truncated
-                    if context_start > 0:
-                        context = "..." + context
-                    if context_end < len(text):
-                        context = context + "..."
-
-                    if len(results) < max_results:
-                        page_matches.append(
+                matches = overlapping_matches(pattern, text)
+                if len(results) >= max_results:
+                    # Result slots are full; only the running count is still
+                    # needed
+                    match_count = sum(1 for _ in matches)
+                else:
+                    # Build context snippets only for the matches that are
+                    # kept; the remainder of the page is just counted.
+                    page_matches = [
+                        match_context(text, match, context_chars)
+                        for match in islice(matches, _MAX_MATCHES_PER_PAGE)
+                    ]
+                    match_count = len(page_matches) + sum(1 for _ in matches)
+                    if page_matches:
+                        results.append(
                             {
-                                "position": pos,
-                                "context": context.replace("\n", " ").strip(),
+                                "page": page_num,
+                                "match_count": match_count,
+                                "matches": page_matches,
                             }
                         )
 
-                    start_pos = pos + 1
+                if match_count:
+                    total_matches += match_count
+                    pages_with_matches.add(page_num)
 
-                if page_matches:
-                    results.append(
-                        {
-                            "page": page_num,
-                            "match_count": len(page_matches),
-                            "matches": page_matches[:5],  # Limit matches per page
-                        }
-                    )
+                # Enough results and a representative match count: stop
+                if len(results) >= max_results and total_matches >= max_results * 10:
+                    stopped_early = page_num < total_pages
+                    break
+            page_texts.close()
 
         if not results:
             return f"No matches found for '{query}' in the PDF ({total_pages} pages searched)."
 
+        # Counts only cover the pages scanned before an early exit
+        matches_key = "matches_scanned" if stopped_early else "total_matches"
         output = {
             "query": query,
-            "total_matches": total_matches,
+            matches_key: total_matches,
             "pages_with_matches": sorted(pages_with_matches),
             "total_pages": total_pages,
-            "results": results[:max_results],
+            "results": results,
             "tip": "Use directed_search_document() + retrieve_document_segments() for focused retrieval, or extract_pdf_text(page_numbers_json='[...]') for full pages.",
         }
+        if stopped_early:
+            output["pages_scanned"] = page_num
+            output["stopped_early"] = True
 
-        return truncate_json_output(json.dumps(output, indent=2))
+        return truncate_json_output(dumps_json(output))
     except Exception as e:
         return f"Error searching PDF: {e!s}"
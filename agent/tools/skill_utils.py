@@ -0,0 +1,27 @@
+"""Lazy access to the utility scripts under skills/.
+
+The skill scripts are plain modules that import their siblings by name, so
+their directory has to be on sys.path before they are imported. Directories
+are added the first time a tool needs them rather than when the tool
+modules are imported.
+"""
+
+import functools
+import sys
+from pathlib import Path
+
+SKILLS_DIR = Path(__file__).parent.parent.parent / "skills"
+
+
+@functools.cache
+def add_skill_path(script_dir: str) -> None:
+    """Put a skills/ script directory on sys.path (once per directory).
+
+    Args:
+        script_dir: Directory relative to skills/, e.g. "pdf/scripts".
+
+    Example:
+        >>> add_skill_path("xlsx")
+        >>> from recalc import recalc
+    """
+    sys.path.insert(0, str(SKILLS_DIR / script_dir))
@@ -4,16 +4,220 @@ Wraps existing skills/xlsx/ utilities for use with OpenAI Agents SDK.
 """
 
 import json
-import sys
+import os
+import re
+import threading
+import time
+import uuid
+import zipfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from itertools import chain, islice
 from pathlib import Path
 
 from agents import function_tool
 
-from .output_utils import truncate_json_output, truncate_output
+from .output_utils import (
+    MAX_TOOL_OUTPUT_CHARS,
+    dumps_json,
+    truncate_json_output,
+    truncate_output,
+)
+from .skill_utils import add_skill_path
+
+_SPREADSHEETML_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_SHEET_PATH = f"{{{_SPREADSHEETML_NS}}}sheets/{{{_SPREADSHEETML_NS}}}sheet"
+_WORKBOOK_VIEW_PATH = (
+    f"{{{_SPREADSHEETML_NS}}}bookViews/{{{_SPREADSHEETML_NS}}}workbookView"
+)
+_ROW_TAG = f"{{{_SPREADSHEETML_NS}}}row"
+_CELL_TAG = f"{{{_SPREADSHEETML_NS}}}c"
+_FORMULA_TAG = f"{{{_SPREADSHEETML_NS}}}f"
+_REL_ID_ATTR = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
+
+# Room left in read_sheet's output for the fields around the row data
+_READ_SHEET_ENVELOPE_CHARS = 1_000
+
+# Open sheet cursors by id, least recently used first. Each holds a read-only
+# workbook (and its file handle) until read to the end, closed or expired.
+_SHEET_CURSOR_LIMIT = 8
+_SHEET_CURSOR_IDLE_SECONDS = 600
+_sheet_cursors: OrderedDict[str, dict] = OrderedDict()
+_sheet_cursors_lock = threading.Lock()
+
+# Try to import python-calamine (Rust-based reader, pandas engine="calamine")
+try:
+    import python_calamine  # noqa: F401
+
+    CALAMINE_AVAILABLE = True
+except ImportError:
+    CALAMINE_AVAILABLE = False
+
+
+def _check_dimensions(ws) -> None:
+    """Recompute a read-only sheet's size when its dimension record is unreliable.
+
+    Read-only iteration stops at the size stored in the sheet's <dimension>
+    record. Some writers omit it or always store "A1:A1", which would hide
+    every other cell, so in those cases the size is taken from the cells.
+    """
+    if ws.max_row is not None and (ws.max_row, ws.max_column) != (1, 1):
+        return
+    ws.reset_dimensions()
+    try:
+        ws.calculate_dimension(force=True)
+    except UnboundLocalError:
+        # openpyxl cannot size a sheet without any cells; leave it unsized
+        pass
+
+
+def _calamine_value(value):
+    """Convert a python-calamine cell value to what openpyxl reads for it.
+
+    calamine reports empty cells as "", every number as a float and
+    date-only cells as dates, where openpyxl gives None, ints for integral
+    numbers and datetimes.
+    """
+    if value.__class__ is float:
+        if value.is_integer() and abs(value) < 2**53:
+            return int(value)
+    elif value.__class__ is str:
+        if not value:
+            return None
+    elif value.__class__ is date:
+        # Spreadsheet dates carry no time zone; openpyxl reads them naive
+        return datetime.combine(value, datetime.min.time())
+    return value
+
+
+def _iter_sheet_rows(file_path: str, ws):
+    """Yield ``(row_number, first_column, values)`` for each row of a sheet.
+
+    Uses python-calamine when installed: it parses the sheet natively, many
+    times faster than openpyxl builds the same rows, and rows are converted
+    to Python values one at a time, so a caller that stops early skips the
+    rest. Otherwise the read-only openpyxl worksheet is streamed. Values are
+    as openpyxl would return them, with None for empty cells.
+    """
+    if CALAMINE_AVAILABLE:
+        from python_calamine import CalamineWorkbook
+
+        try:
+            sheet = CalamineWorkbook.from_path(file_path).get_sheet_by_name(ws.title)
+            rows, start = sheet.iter_rows(), sheet.start
+        except Exception:
+            # Let openpyxl handle anything calamine cannot read
+            rows = None
+        if rows is not None:
+            if start is not None:
+                # iter_rows starts at row 1 but at the first non-empty column;
+                # the empty rows above the data are skipped
+                first_row, first_column = start[0] + 1, start[1] + 1
+                for row_idx, row in enumerate(islice(rows, start[0], None), first_row):
+                    yield row_idx, first_column, [_calamine_value(v) for v in row]
+            return
+
+    # values_only yields plain tuples padded from column A
+    _check_dimensions(ws)
+    for row_idx, row in enumerate(ws.iter_rows(values_only=True), 1):
+        yield row_idx, 1, row
+
+
+def _workbook_sheet_names(file_path: str) -> list[str] | None:
+    """Read sheet names straight from xl/workbook.xml inside the package.
+
+    Even a read-only openpyxl load parses the shared strings and styles,
+    which takes seconds on workbooks with many unique strings; the sheet
+    list is a few hundred bytes. Returns None if the file does not have the
+    usual layout, so the caller can fall back to openpyxl.
+    """
+    from defusedxml import ElementTree as ET
+
+    try:
+        with zipfile.ZipFile(file_path) as zf:
+            root = ET.fromstring(zf.read("xl/workbook.xml"))
+    except (KeyError, zipfile.BadZipFile, ET.ParseError):
+        return None
+    sheets = root.find(f"{{{_SPREADSHEETML_NS}}}sheets")
+    if sheets is None:
+        return None
+    return [sheet.get("name") for sheet in sheets]
+
+
+def _sheet_formulas(
+    file_path: str, sheet_name: str | None
+) -> tuple[str, list[dict]] | None:
+    """Collect a sheet's formula cells by streaming its XML.
 
-# Add skills directory to path for imports
-SKILLS_DIR = Path(__file__).parent.parent.parent / "skills"
-sys.path.insert(0, str(SKILLS_DIR / "xlsx"))
+    Reads the same formulas as a read-only openpyxl scan (shared formulas
+    are translated to each cell; array and data-table formulas are skipped)
+    without loading shared strings or styles or building a Cell per value.
+
+    Args:
+        file_path: Path to the Excel file.
+        sheet_name: Sheet to read, or None for the active sheet.
+
+    Returns:
+        ``(sheet title, [{"cell", "formula"}, ...])``, or None if the sheet
+        cannot be found this way (missing, a chart sheet, an unusual package
+        layout), in which case the caller should fall back to openpyxl.
+    """
+    from defusedxml import ElementTree as ET
+    from openpyxl.formula.translate import Translator
+
+    try:
+        with zipfile.ZipFile(file_path) as zf:
+            workbook = ET.fromstring(zf.read("xl/workbook.xml"))
+            sheets = workbook.findall(_SHEET_PATH)
+            if sheet_name:
+                sheet = next((s for s in sheets if s.get("name") == sheet_name), None)
+            else:
+                view = workbook.find(_WORKBOOK_VIEW_PATH)
+                active = int(view.get("activeTab", 0)) if view is not None else 0
+                sheet = sheets[active] if active < len(sheets) else None
+            if sheet is None:
+                return None
+
+            rels = ET.fromstring(zf.read("xl/_rels/workbook.xml.rels"))
+            rel = next(
+                (r for r in rels if r.get("Id") == sheet.get(_REL_ID_ATTR)), None
+            )
+            if rel is None or not rel.get("Type", "").endswith("/worksheet"):
+                return None
+            target = rel.get("Target", "")
+            part = target.lstrip("/") if target.startswith("/") else f"xl/{target}"
+
+            formulas = []
+            shared = {}
+            with zf.open(part) as sheet_xml:
+                for _event, elem in ET.iterparse(sheet_xml):
+                    if elem.tag == _ROW_TAG:
+                        elem.clear()
+                        continue
+                    if elem.tag != _CELL_TAG:
+                        continue
+                    formula = elem.find(_FORMULA_TAG)
+                    if formula is not None:
+                        coordinate = elem.get("r")
+                        if coordinate is None:
+                            # Positional cells need openpyxl's bookkeeping
+                            return None
+                        kind = formula.get("t")
+                        value = "=" + (formula.text or "")
+                        if kind == "shared":
+                            index = formula.get("si")
+                            if index in shared:
+                                value = shared[index].translate_formula(coordinate)
+                            elif value != "=":
+                                shared[index] = Translator(value, coordinate)
+                        if kind not in ("array", "dataTable"):
+                            formulas.append({"cell": coordinate, "formula": value})
+                    elem.clear()
+    except (KeyError, ValueError, zipfile.BadZipFile, ET.ParseError):
+        return None
+
+    return sheet.get("name"), formulas
 
 
 @function_tool
@@ -33,67 +237,194 @@ def get_sheet_names(file_path: str) -> str:
         return f"Error: File not found: {file_path}"
 
     try:
-        wb = load_workbook(file_path, read_only=True)
-        sheets = wb.sheetnames
-        wb.close()
+        sheets = _workbook_sheet_names(file_path)
+        if sheets is None:
+            wb = load_workbook(file_path, read_only=True)
+            sheets = wb.sheetnames
+            wb.close()
         return f"Sheets in workbook ({len(sheets)} total): {', '.join(sheets)}"
     except Exception as e:
         return f"Error reading Excel file: {e!s}"
 
 
+@function_tool
+def describe_workbook(file_path: str, include_formulas: bool = False) -> str:
+    """Describe every sheet of an Excel file in one call.
+
+    Use this first on an unfamiliar workbook instead of separate
+    get_sheet_names / read_sheet / get_formulas calls just to find sizes.
+
+    Args:
+        file_path: Path to the Excel file (.xlsx or .xlsm).
+        include_formulas: Also count formula cells per sheet (default: False).
+                          This scans every cell, so it is slower on large files.
+
+    Returns:
+        JSON with the active sheet and, for each sheet, its used range,
+        row and column counts (and formula count if requested).
+    """
+    from openpyxl import load_workbook
+
+    path = Path(file_path)
+    if not path.exists():
+        return f"Error: File not found: {file_path}"
+
+    try:
+        # One read-only load gives every sheet's size from its dimension record
+        wb = load_workbook(
+            file_path, data_only=not include_formulas, read_only=True, keep_links=False
+        )
+
+        sheets = []
+        for ws in wb.worksheets:
+            _check_dimensions(ws)
+            info = {
+                "name": ws.title,
+                "dimensions": ws.calculate_dimension() if ws.max_row else None,
+                "rows": ws.max_row or 0,
+                "columns": ws.max_column or 0,
+            }
+            if include_formulas:
+                info["formula_count"] = sum(
+                    1 for row in ws.iter_rows() for cell in row if cell.data_type == "f"
+                )
+            sheets.append(info)
+
+        result = {
+            "sheet_count": len(wb.sheetnames),
+            "active_sheet": wb.active.title if wb.active else None,
+            "sheets": sheets,
+        }
+        # Chart sheets have no cells but still count as sheets
+        if wb.chartsheets:
+            result["chart_sheets"] = [cs.title for cs in wb.chartsheets]
+
+        wb.close()
+        return truncate_json_output(dumps_json(result))
+    except Exception as e:
+        return f"Error reading Excel file: {e!s}"
+
+
+def _take_page(rows) -> tuple[list[list[str]], list[str] | None]:
+    """Convert value rows to strings until they would overflow the output.
+
+    Reading stops at the first row that would not fit, so the next page
+    starts at the first row not returned instead of rows being cut from the
+    serialized result.
+
+    Args:
+        rows: Iterator of value tuples. It is consumed up to and including
+              the first row that does not fit.
+
+    Returns:
+        The converted rows (at least one, if there were any) and the
+        converted row that did not fit, or None if the rows ran out first.
+    """
+    budget = MAX_TOOL_OUTPUT_CHARS - _READ_SHEET_ENVELOPE_CHARS
+    data = []
+    for row in rows:
+        # Convert None to empty string for cleaner output
+        values = [str(cell) if cell is not None else "" for cell in row]
+        # Size as rendered inside "data", plus the "," separator
+        budget -= len(dumps_json(values)) + 1
+        if budget < 0 and data:
+            return data, values
+        data.append(values)
+    return data, None
+
+
 @function_tool
 def read_sheet(
     file_path: str,
     sheet_name: str | None = None,
     start_row: int = 1,
     max_rows: int = 100,
+    columns_json: str | None = None,
 ) -> str:
     """Read data from an Excel sheet with pagination support.
 
     For large sheets, use start_row and max_rows to paginate through data,
-    or use search_sheet() to find specific content first.
+    or use search_sheet() to find specific content first. For wide sheets,
+    use columns_json to read only the columns you need.
 
     Args:
         file_path: Path to the Excel file.
         sheet_name: Name of the sheet to read. If not provided, reads the active sheet.
         start_row: Starting row number (1-indexed, default: 1). Use for pagination.
         max_rows: Maximum number of rows to return (default: 100).
+        columns_json: Optional JSON array of columns to return, as letters or
+                      1-indexed numbers (e.g. '["A", "C"]' or '[1, 3]').
+                      Rows then hold only these columns, in this order.
 
     Returns:
         JSON string containing the sheet data as a list of rows with pagination info.
     """
     from openpyxl import load_workbook
+    from openpyxl.utils import column_index_from_string, get_column_letter
 
     path = Path(file_path)
     if not path.exists():
         return f"Error: File not found: {file_path}"
 
+    # Parse the column selection if provided
+    col_indices = None
+    if columns_json:
+        try:
+            columns = json.loads(columns_json)
+        except json.JSONDecodeError:
+            return f"Error: Invalid JSON for columns: {columns_json}"
+        if not isinstance(columns, list) or not columns:
+            return "Error: columns_json must be a non-empty JSON array."
+        col_indices = []
+        for column in columns:
+            try:
+                if isinstance(column, str):
+                    index = column_index_from_string(column.strip().upper())
+                elif isinstance(column, int) and not isinstance(column, bool):
+                    index = column
+                else:
+                    index = 0
+            except ValueError:
+                index = 0
+            if not 1 <= index <= 18278:  # openpyxl's limit, column XFD
+                return f"Error: Invalid column: {column!r}. Use letters like 'A' or numbers from 1."
+            col_indices.append(index)
+
     try:
-        # data_only=True to get computed values, not formulas
-        wb = load_workbook(file_path, data_only=True)
+        # data_only=True to get computed values, not formulas. read_only
+        # streams the sheet XML instead of building a Cell for every cell.
+        wb = load_workbook(file_path, data_only=True, read_only=True, keep_links=False)
 
         if sheet_name:
             if sheet_name not in wb.sheetnames:
+                wb.close()
                 return f"Error: Sheet '{sheet_name}' not found. Available sheets: {', '.join(wb.sheetnames)}"
             ws = wb[sheet_name]
         else:
             ws = wb.active
 
-        # Count total rows
+        # Count total rows (from the sheet's dimension record, if reliable)
+        _check_dimensions(ws)
         total_rows = ws.max_row or 0
 
         data = []
-        rows_processed = 0
-        for row_idx, row in enumerate(ws.iter_rows(values_only=True), 1):
-            # Skip rows before start_row
-            if row_idx < start_row:
-                continue
-            # Stop after max_rows
-            if rows_processed >= max_rows:
-                break
-            # Convert None to empty string for cleaner output
-            data.append([str(cell) if cell is not None else "" for cell in row])
-            rows_processed += 1
+        capped_by_size = False
+        if max_rows > 0:
+            # Only rows in the requested window are turned into values, and
+            # with a column selection only the span of selected columns
+            first_row = max(start_row, 1)
+            min_col = min(col_indices) if col_indices else None
+            rows = ws.iter_rows(
+                min_row=first_row,
+                max_row=first_row + max_rows - 1,
+                min_col=min_col,
+                max_col=max(col_indices) if col_indices else None,
+                values_only=True,
+            )
+            if col_indices:
+                rows = ([row[i - min_col] for i in col_indices] for row in rows)
+            data, overflow = _take_page(rows)
+            capped_by_size = overflow is not None
 
         wb.close()
 
@@ -109,26 +440,62 @@ def read_sheet(
             "has_more_rows": has_more,
             "data": data,
         }
+        if col_indices:
+            result["columns"] = [get_column_letter(i) for i in col_indices]
 
         if has_more:
             result["next_start_row"] = end_row + 1
             result["tip"] = f"Use start_row={end_row + 1} to get next page"
-
-        return truncate_json_output(json.dumps(result, indent=2))
+        if capped_by_size:
+            result["rows_capped_by_size"] = True
+            result["tip"] = (
+                f"Output size limit reached after {len(data)} rows. Use "
+                f"start_row={end_row + 1} to continue, or columns_json to read fewer columns"
+            )
+
+        return truncate_json_output(dumps_json(result))
     except Exception as e:
         return f"Error reading Excel sheet: {e!s}"
 
 
+def _expire_sheet_cursors() -> None:
+    """Close cursors idle past the timeout, then the oldest over the limit.
+
+    The caller must hold ``_sheet_cursors_lock``.
+    """
+    deadline = time.monotonic() - _SHEET_CURSOR_IDLE_SECONDS
+    for token, cursor in list(_sheet_cursors.items()):
+        if cursor["last_used"] < deadline:
+            del _sheet_cursors[token]
+            cursor["workbook"].close()
+    while len(_sheet_cursors) > _SHEET_CURSOR_LIMIT:
+        _, cursor = _sheet_cursors.popitem(last=False)
+        cursor["workbook"].close()
+
+
 @function_tool
-def get_formulas(file_path: str, sheet_name: str | None = None) -> str:
-    """Get formulas from an Excel sheet (not computed values).
+def open_sheet_cursor(
+    file_path: str,
+    sheet_name: str | None = None,
+    start_row: int = 1,
+    page_size: int = 100,
+) -> str:
+    """Open a cursor for reading a large sheet page by page.
+
+    Unlike repeated read_sheet calls, which re-open the file and re-parse the
+    sheet up to start_row each time, a cursor keeps the sheet open and
+    continues where the previous page ended. Read pages with
+    next_sheet_page(); cursors close after the last page, after 10 idle
+    minutes, or with close_sheet_cursor().
 
     Args:
         file_path: Path to the Excel file.
         sheet_name: Name of the sheet to read. If not provided, reads the active sheet.
+        start_row: Row to start from (1-indexed, default: 1).
+        page_size: Maximum number of rows per page (default: 100).
 
     Returns:
-        JSON string containing cells with formulas and their formula strings.
+        JSON with the cursor id, sheet name and total row count.
     """
     from openpyxl import load_workbook
 
@@ -136,39 +503,186 @@ def get_formulas(file_path: str, sheet_name: str | None = None) -> str:
     if not path.exists():
         return f"Error: File not found: {file_path}"
 
+    if page_size < 1:
+        return "Error: page_size must be at least 1."
+
     try:
-        # data_only=False to get formulas, not values
-        wb = load_workbook(file_path, data_only=False)
+        wb = load_workbook(file_path, data_only=True, read_only=True, keep_links=False)
 
         if sheet_name:
             if sheet_name not in wb.sheetnames:
-                return f"Error: Sheet '{sheet_name}' not found."
+                wb.close()
+                return f"Error: Sheet '{sheet_name}' not found. Available sheets: {', '.join(wb.sheetnames)}"
             ws = wb[sheet_name]
         else:
             ws = wb.active
 
-        formulas = []
-        for row in ws.iter_rows():
-            for cell in row:
-                if (
-                    cell.value
-                    and isinstance(cell.value, str)
-                    and cell.value.startswith("=")
-                ):
-                    formulas.append({"cell": cell.coordinate, "formula": cell.value})
+        _check_dimensions(ws)
+        first_row = max(start_row, 1)
+        token = uuid.uuid4().hex[:12]
+        cursor = {
+            "workbook": wb,
+            "rows": ws.iter_rows(min_row=first_row, values_only=True),
+            "sheet_name": ws.title,
+            "next_row": first_row,
+            "page_size": page_size,
+            "total_rows": ws.max_row or 0,
+            "last_used": time.monotonic(),
+        }
+        with _sheet_cursors_lock:
+            _sheet_cursors[token] = cursor
+            _expire_sheet_cursors()
 
-        wb.close()
+        return dumps_json(
+            {
+                "cursor": token,
+                "sheet_name": cursor["sheet_name"],
+                "total_rows": cursor["total_rows"],
+                "start_row": first_row,
+                "page_size": page_size,
+                "tip": f"Call next_sheet_page(cursor='{token}') for each page",
+            }
+        )
+    except Exception as e:
+        return f"Error opening sheet cursor: {e!s}"
+
+
+@function_tool
+def next_sheet_page(cursor: str) -> str:
+    """Read the next page of rows from a cursor opened with open_sheet_cursor().
+
+    Args:
+        cursor: Cursor id returned by open_sheet_cursor().
+
+    Returns:
+        JSON page in the same shape as read_sheet. When the last page has
+        been returned the cursor is closed automatically.
+    """
+    # Take the cursor out while reading so concurrent calls cannot share it
+    with _sheet_cursors_lock:
+        _expire_sheet_cursors()
+        state = _sheet_cursors.pop(cursor, None)
+    if state is None:
+        return f"Error: Cursor '{cursor}' not found. It may have been read to the end, closed or expired; open a new one with open_sheet_cursor()."
+
+    try:
+        data, overflow = _take_page(islice(state["rows"], state["page_size"]))
+        if overflow is not None:
+            # Put back the row that did not fit; it starts the next page
+            state["rows"] = chain([overflow], state["rows"])
+
+        start_row = state["next_row"]
+        state["next_row"] += len(data)
+        has_more = state["next_row"] <= state["total_rows"] and (
+            overflow is not None or len(data) == state["page_size"]
+        )
+
+        result = {
+            "cursor": cursor,
+            "sheet_name": state["sheet_name"],
+            "start_row": start_row,
+            "end_row": state["next_row"] - 1 if data else start_row,
+            "rows_returned": len(data),
+            "total_rows": state["total_rows"],
+            "has_more_rows": has_more,
+            "data": data,
+        }
+        if overflow is not None:
+            result["rows_capped_by_size"] = True
+    except Exception as e:
+        state["workbook"].close()
+        return f"Error reading sheet page: {e!s}"
+
+    if has_more:
+        state["last_used"] = time.monotonic()
+        with _sheet_cursors_lock:
+            _sheet_cursors[cursor] = state
+    else:
+        state["workbook"].close()
+        result["cursor_closed"] = True
+
+    return dumps_json(result)
+
+
+@function_tool
+def close_sheet_cursor(cursor: str) -> str:
+    """Close a cursor opened with open_sheet_cursor() before reaching the end.
+
+    Args:
+        cursor: Cursor id returned by open_sheet_cursor().
+
+    Returns:
+        Confirmation message or error.
+    """
+    with _sheet_cursors_lock:
+        state = _sheet_cursors.pop(cursor, None)
+    if state is None:
+        return (
+            f"Error: Cursor '{cursor}' not found. It may already be closed or expired."
+        )
+    state["workbook"].close()
+    return f"Closed cursor '{cursor}'."
+
+
+@function_tool
+def get_formulas(file_path: str, sheet_name: str | None = None) -> str:
+    """Get formulas from an Excel sheet (not computed values).
+
+    Args:
+        file_path: Path to the Excel file.
+        sheet_name: Name of the sheet to read. If not provided, reads the active sheet.
+
+    Returns:
+        JSON string containing cells with formulas and their formula strings.
+    """
+    from openpyxl import load_workbook
+
+    path = Path(file_path)
+    if not path.exists():
+        return f"Error: File not found: {file_path}"
+
+    try:
+        found = _sheet_formulas(file_path, sheet_name)
+        if found is not None:
+            title, formulas = found
+        else:
+            # data_only=False to get formulas, not values. read_only streams
+            # just this sheet instead of building every cell of the workbook.
+            wb = load_workbook(
+                file_path, data_only=False, read_only=True, keep_links=False
+            )
+
+            if sheet_name:
+                if sheet_name not in wb.sheetnames:
+                    wb.close()
+                    return f"Error: Sheet '{sheet_name}' not found."
+                ws = wb[sheet_name]
+            else:
+                ws = wb.active
+            _check_dimensions(ws)
+
+            formulas = []
+            for row in ws.iter_rows():
+                for cell in row:
+                    # The reader already typed formula cells as "f"; array
+                    # formulas come back as objects rather than formula strings
+                    if cell.data_type == "f" and isinstance(cell.value, str):
+                        formulas.append(
+                            {"cell": cell.coordinate, "formula": cell.value}
+                        )
+
+            title = ws.title
+            wb.close()
 
         if not formulas:
-            return f"No formulas found in sheet '{ws.title}'."
+            return f"No formulas found in sheet '{title}'."
 
-        return json.dumps(
+        return dumps_json(
             {
-                "sheet_name": ws.title,
+                "sheet_name": title,
                 "formula_count": len(formulas),
                 "formulas": formulas,
-            },
-            indent=2,
+            }
         )
     except Exception as e:
         return f"Error reading formulas: {e!s}"
@@ -201,7 +715,16 @@ def analyze_data(
         return f"Error: File not found: {file_path}"
 
     try:
-        df = pd.read_excel(file_path, sheet_name=sheet_name)
+        if analysis_type == "head":
+            # openpyxl streams the sheet and stops after the rows needed;
+            # calamine would load the whole sheet before returning any.
+            read_options = {"engine": "openpyxl", "nrows": 10}
+        else:
+            # calamine parses the sheet natively when installed
+            read_options = {"engine": "calamine" if CALAMINE_AVAILABLE else None}
+        # sheet_name=None would make pandas return every sheet, so default to
+        # the first one.
+        df = pd.read_excel(file_path, sheet_name=sheet_name or 0, **read_options)
 
         if analysis_type == "summary":
             result = f"Statistical Summary for '{sheet_name or 'Sheet1'}':\n{df.describe().to_string()}"
@@ -209,11 +732,14 @@ def analyze_data(
         if analysis_type == "info":
             info_str = f"Shape: {df.shape[0]} rows x {df.shape[1]} columns\n\n"
             info_str += "Column Info:\n"
-            for col in df.columns:
-                non_null = df[col].notna().sum()
-                info_str += (
-                    f"  {col}: {df[col].dtype}, {non_null}/{len(df)} non-null values\n"
+            # One vectorized pass counts non-null values for every column
+            non_null_counts = df.notna().sum()
+            info_str += "".join(
+                f"  {col}: {dtype}, {non_null}/{len(df)} non-null values\n"
+                for col, dtype, non_null in zip(
+                    df.columns, df.dtypes, non_null_counts, strict=True
                 )
+            )
             return truncate_output(info_str)
         if analysis_type == "head":
             result = f"First 10 rows:\n{df.head(10).to_string()}"
@@ -319,6 +845,75 @@ def add_formula(
         return f"Error adding formula: {e!s}"
 
 
+@function_tool
+def write_cells(
+    file_path: str,
+    updates_json: str,
+    output_path: str | None = None,
+) -> str:
+    """Write values or formulas to many cells in one pass.
+
+    Prefer this over repeated write_cell/add_formula calls: the workbook is
+    loaded and saved once for the whole batch.
+
+    Args:
+        file_path: Path to the Excel file.
+        updates_json: JSON array of updates, each with "sheet", "cell" and "value".
+                      Values starting with "=" are stored as formulas; set
+                      "is_formula": true to add the "=" (as add_formula does).
+                      Example: '[{"sheet": "Sheet1", "cell": "A1", "value": "Total"},
+                                 {"sheet": "Sheet1", "cell": "B1", "value": "=SUM(B2:B9)"}]'
+        output_path: Where to save. If not provided, overwrites the input file.
+
+    Returns:
+        Success message with the number of cells written, or error.
+    """
+    from openpyxl import load_workbook
+
+    path = Path(file_path)
+    if not path.exists():
+        return f"Error: File not found: {file_path}"
+
+    try:
+        updates = json.loads(updates_json)
+    except json.JSONDecodeError as e:
+        return f"Error: Invalid JSON for updates: {e!s}"
+
+    if not isinstance(updates, list) or not updates:
+        return "Error: updates_json must be a non-empty JSON array."
+    for i, update in enumerate(updates):
+        if (
+            not isinstance(update, dict)
+            or not {"sheet", "cell", "value"} <= update.keys()
+        ):
+            return (
+                f"Error: Update {i} must be an object with 'sheet', 'cell' and 'value'."
+            )
+
+    try:
+        wb = load_workbook(file_path)
+
+        # Report every unknown sheet at once, before anything is written
+        missing = sorted({u["sheet"] for u in updates} - set(wb.sheetnames))
+        if missing:
+            wb.close()
+            return f"Error: Sheets not found: {', '.join(missing)}"
+
+        for update in updates:
+            value = update["value"]
+            if update.get("is_formula") and not str(value).startswith("="):
+                value = f"={value}"
+            wb[update["sheet"]][update["cell"]] = value
+
+        save_path = output_path or file_path
+        wb.save(save_path)
+        wb.close()
+
+        return f"Successfully wrote {len(updates)} cells. Saved to: {save_path}"
+    except Exception as e:
+        return f"Error writing cells: {e!s}"
+
+
 @function_tool
 def recalculate_formulas(file_path: str, timeout: int = 30) -> str:
     """Recalculate all Excel formulas using LibreOffice.
@@ -342,16 +937,147 @@ def recalculate_formulas(file_path: str, timeout: int = 30) -> str:
 
     try:
         # Import existing skill function
+        add_skill_path("xlsx")
         from recalc import recalc
 
         result = recalc(file_path, timeout)
-        return json.dumps(result, indent=2)
+        return dumps_json(result)
     except ImportError:
         return "Error: recalc module not found. Make sure skills/xlsx/recalc.py exists and LibreOffice is installed."
     except Exception as e:
         return f"Error recalculating formulas: {e!s}"
 
 
+def _scan_sheet(
+    file_path: str, ws, pattern, max_results: int, max_scan_rows: int
+) -> dict:
+    """Find the cells of one sheet whose value matches ``pattern``.
+
+    Keeps the first ``max_results`` matches and counts the rest, stopping
+    early once ten times that many are counted or after ``max_scan_rows``
+    rows.
+
+    Returns:
+        Dict with ``results``, ``total_matches``, sorted ``rows_with_matches``,
+        ``stopped_early`` and ``scan_truncated``.
+    """
+    from openpyxl.utils import get_column_letter
+
+    results = []
+    total_matches = 0
+    rows_with_matches = set()
+    stopped_early = False
+    scan_truncated = False
+    search = pattern.search
+
+    # Positions give the row and column without building a Cell per value
+    for row_idx, first_column, row in _iter_sheet_rows(file_path, ws):
+        if row_idx > max_scan_rows:
+            # Bound the work on huge sheets; the output says so
+            scan_truncated = True
+            break
+
+        for col_idx, value in enumerate(row, first_column):
+            if value is None:
+                continue
+
+            cell_str = value if isinstance(value, str) else str(value)
+            if not search(cell_str):
+                continue
+
+            total_matches += 1
+            rows_with_matches.add(row_idx)
+
+            if len(results) < max_results:
+                results.append(
+                    {
+                        "cell": f"{get_column_letter(col_idx)}{row_idx}",
+                        "row": row_idx,
+                        "column": col_idx,
+                        "value": (
+                            cell_str[:200] + "..." if len(cell_str) > 200 else cell_str
+                        ),
+                    }
+                )
+
+        # Enough results and a representative match count: stop
+        if len(results) >= max_results and total_matches >= max_results * 10:
+            stopped_early = True
+            break
+
+    return {
+        "results": results,
+        "total_matches": total_matches,
+        "rows_with_matches": sorted(rows_with_matches),
+        "stopped_early": stopped_early,
+        "scan_truncated": scan_truncated,
+    }
+
+
+def _search_all_sheets(
+    file_path: str,
+    titles: list[str],
+    query: str,
+    pattern,
+    *,
+    max_results: int,
+    max_scan_rows: int,
+) -> str:
+    """Run search_sheet over every worksheet and merge the results.
+
+    Sheets are scanned on a small thread pool, each with its own read-only
+    workbook (openpyxl workbooks are not thread-safe); file reads, zlib
+    inflation and calamine's native parsing overlap across threads.
+    """
+    from openpyxl import load_workbook
+
+    def scan(title: str) -> dict:
+        wb = load_workbook(file_path, data_only=True, read_only=True, keep_links=False)
+        try:
+            return _scan_sheet(
+                file_path, wb[title], pattern, max_results, max_scan_rows
+            )
+        finally:
+            wb.close()
+
+    if titles:
+        max_workers = min(4, os.cpu_count() or 1, len(titles))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            found = list(executor.map(scan, titles))
+    else:
+        found = []
+
+    results = []
+    matches_per_sheet = {}
+    for title, sheet_found in zip(titles, found, strict=True):
+        if sheet_found["total_matches"]:
+            matches_per_sheet[title] = sheet_found["total_matches"]
+        for result in sheet_found["results"]:
+            if len(results) < max_results:
+                results.append({"sheet": title, **result})
+
+    if not results:
+        return f"No matches found for '{query}' in any of the {len(titles)} sheets."
+
+    output = {
+        "query": query,
+        "sheets_searched": len(titles),
+        "total_matches": sum(matches_per_sheet.values()),
+        "matches_per_sheet": matches_per_sheet,
+        "results": results,
+        "tip": "Use read_sheet(sheet_name=..., start_row=N) for surrounding rows.",
+    }
+    if any(sheet_found["stopped_early"] for sheet_found in found):
+        # Counts only cover the rows scanned before each early exit
+        output["stopped_early"] = True
+    if any(sheet_found["scan_truncated"] for sheet_found in found):
+        # Rows past max_scan_rows were not searched
+        output["scan_truncated"] = True
+        output["rows_scanned"] = max_scan_rows
+
+    return truncate_json_output(dumps_json(output))
+
+
 @function_tool
 def search_sheet(
     file_path: str,
@@ -359,6 +1085,9 @@ def search_sheet(
     sheet_name: str | None = None,
     case_sensitive: bool = False,
     max_results: int = 50,
+    *,
+    max_scan_rows: int = 100_000,
+    search_all: bool = False,
 ) -> str:
     """Search for text within an Excel sheet and return matching cells.
 
@@ -371,6 +1100,11 @@ def search_sheet(
         sheet_name: Name of sheet to search. If not provided, searches active sheet.
         case_sensitive: Whether the search should be case-sensitive (default: False).
         max_results: Maximum number of results to return (default: 50).
+        max_scan_rows: Only search the first N rows (default: 100000). Raise it
+                       to search further into very large sheets.
+        search_all: Search every sheet instead of only the active one when no
+                    sheet_name is given (default: False). Each result then
+                    names its sheet.
 
     Returns:
         JSON with matching cells, their values, and row numbers.
@@ -386,60 +1120,63 @@ def search_sheet(
         return "Error: Search query cannot be empty."
 
     try:
-        wb = load_workbook(file_path, data_only=True)
+        # read_only streams the sheet instead of building the full cell grid
+        wb = load_workbook(file_path, data_only=True, read_only=True, keep_links=False)
 
         if sheet_name:
             if sheet_name not in wb.sheetnames:
+                wb.close()
                 return f"Error: Sheet '{sheet_name}' not found. Available sheets: {', '.join(wb.sheetnames)}"
             ws = wb[sheet_name]
         else:
             ws = wb.active
 
-        results = []
-        total_matches = 0
-        rows_with_matches = set()
-        search_query = query if case_sensitive else query.lower()
-
-        for row in ws.iter_rows():
-            for cell in row:
-                if cell.value is None:
-                    continue
-
-                cell_str = str(cell.value)
-                search_text = cell_str if case_sensitive else cell_str.lower()
-
-                if search_query in search_text:
-                    total_matches += 1
-                    rows_with_matches.add(cell.row)
-
-                    if len(results) < max_results:
-                        results.append(
-                            {
-                                "cell": cell.coordinate,
-                                "row": cell.row,
-                                "column": cell.column,
-                                "value": (
-                                    cell_str[:200] + "..."
-                                    if len(cell_str) > 200
-                                    else cell_str
-                                ),
-                            }
-                        )
+        # IGNORECASE matches against the original value, so no lowercased
+        # copy of every cell is needed.
+        pattern = re.compile(re.escape(query), 0 if case_sensitive else re.IGNORECASE)
+
+        if search_all and not sheet_name:
+            titles = [sheet.title for sheet in wb.worksheets]
+            wb.close()
+            return _search_all_sheets(
+                file_path,
+                titles,
+                query,
+                pattern,
+                max_results=max_results,
+                max_scan_rows=max_scan_rows,
+            )
+
+        found = _scan_sheet(file_path, ws, pattern, max_results, max_scan_rows)
+        results = found["results"]
+        scan_truncated = found["scan_truncated"]
 
         wb.close()
 
         if not results:
+            if scan_truncated:
+                return (
+                    f"No matches found for '{query}' in the first {max_scan_rows:,} rows "
+                    "of the sheet. Raise max_scan_rows to search further."
+                )
             return f"No matches found for '{query}' in the sheet."
 
         output = {
             "query": query,
             "sheet_name": ws.title,
-            "total_matches": total_matches,
-            "rows_with_matches": sorted(rows_with_matches)[:50],  # Limit row list
+            "total_matches": found["total_matches"],
+            "rows_with_matches": found["rows_with_matches"][:50],  # Limit row list
             "results": results,
             "tip": "Use directed_search_document() + retrieve_document_segments() for focused retrieval, or read_sheet(start_row=N) for surrounding rows.",
         }
-
-        return truncate_json_output(json.dumps(output, indent=2))
+        if found["stopped_early"]:
+            # Counts only cover the rows scanned before the early exit
+            output["stopped_early"] = True
+        if scan_truncated:
+            # Rows past max_scan_rows were not searched
+            output["scan_truncated"] = True
+            output["rows_scanned"] = max_scan_rows
+
+        return truncate_json_output(dumps_json(output))
     except Exception as e:
         return f"Error searching Excel sheet: {e!s}"
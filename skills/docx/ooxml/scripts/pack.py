@@ -74,7 +74,9 @@ def pack_document(input_dir, output_file, validate=False):
 
         # Create final Office file as zip archive
         output_file.parent.mkdir(parents=True, exist_ok=True)
-        with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as zf:
+        with zipfile.ZipFile(
+            output_file, "w", zipfile.ZIP_DEFLATED, compresslevel=6
+        ) as zf:
             for f in temp_content_dir.rglob("*"):
                 if f.is_file():
                     zf.write(f, f.relative_to(temp_content_dir))
@@ -10,6 +10,19 @@ from pypdf import PdfReader, PdfWriter
 def fill_pdf_fields(input_pdf_path: str, fields_json_path: str, output_pdf_path: str):
     with open(fields_json_path) as f:
         fields = json.load(f)
+    try:
+        fill_pdf_fields_from_list(input_pdf_path, fields, output_pdf_path)
+    except ValueError as e:
+        print(e)
+        sys.exit(1)
+
+
+# Same as fill_pdf_fields, but takes the field list directly (for in-process
+# callers) and raises ValueError listing every problem instead of exiting.
+# Callers that already parsed the input can pass their PdfReader as `reader`.
+def fill_pdf_fields_from_list(
+    input_pdf_path: str, fields: list, output_pdf_path: str, reader=None
+):
     # Group by page number.
     fields_by_page = {}
     for field in fields:
@@ -20,28 +33,26 @@ def fill_pdf_fields(input_pdf_path: str, fields_json_path: str, output_pdf_path:
                 fields_by_page[page] = {}
             fields_by_page[page][field_id] = field["value"]
 
-    reader = PdfReader(input_pdf_path)
+    if reader is None:
+        reader = PdfReader(input_pdf_path)
 
-    has_error = False
+    errors = []
     field_info = get_field_info(reader)
     fields_by_ids = {f["field_id"]: f for f in field_info}
     for field in fields:
         existing_field = fields_by_ids.get(field["field_id"])
         if not existing_field:
-            has_error = True
-            print(f"ERROR: `{field['field_id']}` is not a valid field ID")
+            errors.append(f"ERROR: `{field['field_id']}` is not a valid field ID")
         elif field["page"] != existing_field["page"]:
-            has_error = True
-            print(
+            errors.append(
                 f"ERROR: Incorrect page number for `{field['field_id']}` (got {field['page']}, expected {existing_field['page']})"
             )
         elif "value" in field:
             err = validation_error_for_field_value(existing_field, field["value"])
             if err:
-                print(err)
-                has_error = True
-    if has_error:
-        sys.exit(1)
+                errors.append(err)
+    if errors:
+        raise ValueError("\n".join(errors))
 
     writer = PdfWriter(clone_from=reader)
     for page, field_values in fields_by_page.items():
@@ -92,6 +103,10 @@ def monkeypatch_pydpf_method():
     from pypdf.constants import FieldDictionaryAttributes
     from pypdf.generic import DictionaryObject
 
+    # Patch only once; re-patching would wrap the patch in itself again.
+    if getattr(DictionaryObject.get_inherited, "_patched_for_opt", False):
+        return
+
     original_get_inherited = DictionaryObject.get_inherited
 
     def patched_get_inherited(self, key: str, default=None):
@@ -103,6 +118,7 @@ def monkeypatch_pydpf_method():
                 result = [r[0] for r in result]
         return result
 
+    patched_get_inherited._patched_for_opt = True
     DictionaryObject.get_inherited = patched_get_inherited
 
 